@@ -15,6 +15,9 @@ from typing import Any, cast
 import structlog
 from structlog.types import EventDict
 
+# (level, format_json) of the active configuration, None until configured
+_configured_with: tuple[str, bool] | None = None
+
 
 def add_module_name(
     _logger: logging.Logger, _method_name: str, event_dict: EventDict
@@ -74,6 +77,10 @@ def configure_structured_logging(
     *, level: str = "INFO", format_json: bool = True
 ) -> None:
     """Configure structured logging with JSON output."""
+    global _configured_with
+    if _configured_with == (level, format_json):
+        return  # Already configured with these settings
+
     # Clear any existing configuration
     structlog.reset_defaults()
 
@@ -109,6 +116,10 @@ def configure_structured_logging(
         level=getattr(logging, level.upper()),
     )
 
+    # Loggers handed out under the previous configuration are stale
+    _get_named_logger.cache_clear()
+    _configured_with = (level, format_json)
+
 
 def get_logger(name: str | None = None) -> structlog.BoundLogger:
     """Get a structured logger instance.
@@ -130,6 +141,12 @@ def get_logger(name: str | None = None) -> structlog.BoundLogger:
         else:
             name = "unknown"
 
+    return _get_named_logger(name)
+
+
+@functools.lru_cache(maxsize=512)
+def _get_named_logger(name: str) -> structlog.BoundLogger:
+    """Return the cached structlog logger for name."""
     return cast("structlog.BoundLogger", structlog.get_logger(name))
 
 
@@ -261,7 +261,7 @@ async def handle_clear_history(
         chatbot.conversation_manager.clear_history()
 
         # Re-set system message if available
-        system_prompt = chatbot.config.chatbot_config.get("system_prompt", "")
+        system_prompt = chatbot.config.chatbot_config["system_prompt"]
         if system_prompt:
             chatbot.conversation_manager.set_system_message(system_prompt)
 
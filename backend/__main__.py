@@ -4,6 +4,7 @@ Usage: python -m backend [--server-path PATH] [--show-config].
 """
 
 import argparse
+import functools
 import logging
 import subprocess
 import sys
@@ -12,8 +13,9 @@ from pathlib import Path
 from .chatbot import ChatBot
 
 
-def parse_args():
-    """Parse command line arguments."""
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser once and reuse it across parses."""
     parser = argparse.ArgumentParser(
         description="MCP ChatBot Backend Server",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -40,7 +42,12 @@ Examples:
         "--verbose", "-v", action="store_true", help="Enable verbose logging"
     )
 
-    return parser.parse_args()
+    return parser
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    return _build_parser().parse_args(argv)
 
 
 def launch_backend_server() -> None:
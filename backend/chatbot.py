@@ -1,4 +1,5 @@
 import asyncio
+import functools
 import json
 import logging
 import shlex
@@ -28,8 +29,6 @@ class ChatBot:
     ) -> None:
         """Initialize the ChatBot with configuration and session management."""
         self.config = ServerConfig()
-        self.mcp_session = MCPSession()
-        self.conversation_manager = ConversationManager(self.mcp_session)
         self.connection_config = ConnectionConfig(connection_config_file)
         self.logger = logging.getLogger(__name__)
         self._config_version: str = ""
@@ -38,6 +37,16 @@ class ChatBot:
             "ChatBot initialized (will load all configuration from MCP server)"
         )
 
+    @functools.cached_property
+    def mcp_session(self) -> MCPSession:
+        """MCP session, created on first use rather than at construction."""
+        return MCPSession()
+
+    @functools.cached_property
+    def conversation_manager(self) -> ConversationManager:
+        """Conversation manager bound to the MCP session, created on first use."""
+        return ConversationManager(self.mcp_session)
+
     async def connect_to_server(
         self,
         server_command: str | list[str] | None = None,
@@ -63,6 +72,10 @@ class ChatBot:
             await bot.connect_to_server(server_command=["python", "/path/to/server.py"])
         """
         try:
+            # Build the manager first so a missing API key fails before the server
+            # subprocess is spawned
+            conversation_manager = self.conversation_manager
+
             # Determine server command
             if server_command:
                 # Direct command overrides config
@@ -89,7 +102,7 @@ class ChatBot:
                 await self.config.load_from_server(self.mcp_session.session)
 
             # Initialize system message from server config
-            system_prompt = self.config.chatbot_config.get("system_prompt", "")
+            system_prompt = self.config.chatbot_config["system_prompt"]
             if not system_prompt:
                 msg = (
                     "Server configuration missing required 'chatbot.system_prompt'. "
@@ -98,7 +111,7 @@ class ChatBot:
                 )
                 raise ConfigurationError(msg, error_code="MISSING_SYSTEM_PROMPT")
 
-            self.conversation_manager.set_system_message(system_prompt)
+            conversation_manager.set_system_message(system_prompt)
 
             self.logger.info("ChatBot fully configured from server")
 
@@ -137,20 +150,11 @@ class ChatBot:
                 content_text = extract_tool_content(result)
                 server_config = json.loads(content_text)
 
-                # Update local config directly
-                self.config.config = server_config
-
-                # Update logging configuration if changed
-                if "logging" in server_config and server_config["logging"]["enabled"]:
-                    log_level = getattr(
-                        logging, server_config["logging"]["level"].upper()
-                    )
-                    logging.getLogger().setLevel(log_level)
+                # Merge over the defaults and update logging
+                self.config.apply_server_config(server_config)
 
                 # Update system message if changed
-                new_system_prompt = server_config.get("chatbot", {}).get(
-                    "system_prompt", ""
-                )
+                new_system_prompt = self.config.chatbot_config["system_prompt"]
                 if not new_system_prompt:
                     self.logger.warning(
                         "Server config missing system_prompt after update"
@@ -234,12 +238,19 @@ class ChatBot:
     async def cleanup(self) -> None:
         """Clean up resources."""
         try:
-            if self.config.chatbot_config.get("clear_history_on_exit", False):
-                self.conversation_manager.clear_history()
-                self.logger.info(
-                    "Conversation history cleared on exit (per server configuration)"
-                )
-            await self.mcp_session.cleanup()
+            try:
+                # Only clear a manager that exists; building one here needs the API key
+                if (
+                    "conversation_manager" in vars(self)
+                    and self.config.chatbot_config["clear_history_on_exit"]
+                ):
+                    self.conversation_manager.clear_history()
+                    self.logger.info(
+                        "Conversation history cleared on exit "
+                        "(per server configuration)"
+                    )
+            finally:
+                await self.mcp_session.cleanup()
         except (KeyboardInterrupt, asyncio.CancelledError):
             # Handle graceful shutdown when interrupted
             pass
@@ -1,3 +1,4 @@
+import copy
 import json
 import logging
 from typing import Any, ClassVar
@@ -33,9 +34,33 @@ class ServerConfig:
         "load_config": "Load configuration from server file",
     }
 
+    # Section defaults applied at construction and merged under whatever the
+    # server returns, so readers can index keys without a fallback. Values
+    # mirror server/default_backend_config.yaml; system_prompt stays empty
+    # because the server must supply one
+    DEFAULT_CONFIG: ClassVar[dict[str, dict[str, Any]]] = {
+        "openai": {
+            "model": "gpt-4o-mini",
+            "temperature": 0.8,
+            "max_tokens": 2000,
+            "top_p": 1.0,
+            "presence_penalty": 0.0,
+            "frequency_penalty": 0.0,
+        },
+        "chatbot": {
+            "system_prompt": "",
+            "max_conversation_history": 100,
+            "clear_history_on_exit": True,
+        },
+        "logging": {
+            "enabled": True,
+            "level": "INFO",
+        },
+    }
+
     def __init__(self) -> None:
-        """Initialize the ServerConfig with empty configuration and logging setup."""
-        self.config: dict[str, Any] = {}
+        """Initialize the ServerConfig with default sections and logging setup."""
+        self.config: dict[str, Any] = self._with_defaults({})
         self.logger = logging.getLogger(__name__)
         self._server_capabilities: dict[str, bool] = {}
 
@@ -75,12 +100,7 @@ class ServerConfig:
             # Load configuration from server
             result = await session.call_tool("get_config", arguments={})
             content_text = extract_tool_content(result)
-            self.config = json.loads(content_text)
-
-            # Update logging configuration
-            if "logging" in self.config and self.config["logging"]["enabled"]:
-                log_level = getattr(logging, self.config["logging"]["level"].upper())
-                logging.getLogger().setLevel(log_level)
+            self.apply_server_config(json.loads(content_text))
 
             self.logger.info("Configuration loaded from server")
 
@@ -131,6 +151,31 @@ class ServerConfig:
             )
             raise wrapped_error from e
 
+    def apply_server_config(self, loaded: dict[str, Any]) -> None:
+        """Replace the config with ``loaded`` over the defaults and apply logging.
+
+        Both the initial load and hot reloads go through here, so every reader
+        sees the default keys whatever the server omitted.
+        """
+        self.config = self._with_defaults(loaded)
+
+        # Only a server that sends logging settings may override the root level,
+        # so a --log-level given on the command line survives other configs
+        if "logging" in loaded and self.config["logging"]["enabled"]:
+            log_level = getattr(logging, self.config["logging"]["level"].upper())
+            logging.getLogger().setLevel(log_level)
+
+    @classmethod
+    def _with_defaults(cls, loaded: dict[str, Any]) -> dict[str, Any]:
+        """Return ``loaded`` with each default section filled in beneath it."""
+        config = copy.deepcopy(cls.DEFAULT_CONFIG)
+        for section, values in loaded.items():
+            if section in config and isinstance(values, dict):
+                config[section].update(values)
+            else:
+                config[section] = values
+        return config
+
     def has_server_capability(self, tool_name: str) -> bool:
         """Check if the server supports a specific configuration tool."""
         return self._server_capabilities.get(tool_name, False)
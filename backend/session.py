@@ -25,6 +25,8 @@ STDIOTransport = tuple[
 class MCPSession:
     """Manages MCP server connection and tool operations for any compatible MCP server."""
 
+    __slots__ = ("exit_stack", "logger", "server_info", "session")
+
     def __init__(self) -> None:
         """Initialize the MCPSession with empty session and logging setup."""
         self.session: ClientSession | None = None
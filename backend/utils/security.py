@@ -4,30 +4,76 @@ This module provides utilities to ensure secrets are never logged or exposed
 in stack traces, following security best practices.
 """
 
+import functools
 import logging
 import os
 import re
-from collections.abc import Mapping, Sequence
+from collections.abc import Collection, Mapping, Sequence
 from typing import Any, cast
 
 from backend.exceptions import ConfigurationError
 
-# Pattern to identify potential secrets in strings
-SECRET_PATTERNS = [
+try:
+    import re2
+except ImportError:  # Optional linear-time engine; the stdlib re is the fallback
+    re2 = None  # type: ignore[assignment]
+
+# Patterns to identify potential secrets in strings, applied in order. The
+# key=value and bearer patterns run first so a standalone match can never
+# swallow a key name and leave its value behind. Flags are inline so the same
+# sources compile under both re and re2.
+_SECRET_PATTERN_SOURCES: tuple[str, ...] = (
     # API keys, secrets, tokens, passwords with key=value format
-    re.compile(
-        r'(?i)(api[_\-]?key|secret|token|password|auth)["\']?\s*[:=]\s*["\']?([a-zA-Z0-9._\-/+=]{8,})',
-        re.IGNORECASE,
-    ),
+    r'(?i)((?:api[_\-]?key|secret|token|password|auth)["\']?\s*[:=]\s*["\']?)[a-zA-Z0-9._\-/+=]{8,}',
     # Bearer tokens
-    re.compile(r"(?i)(bearer\s+)([a-zA-Z0-9._\-/+=]{20,})", re.IGNORECASE),
-    # OpenAI API keys (standalone)
-    re.compile(r"(sk-[a-zA-Z0-9._\-/+=]{20,})", re.IGNORECASE),
-    # JWT tokens
-    re.compile(r"(eyJ[a-zA-Z0-9._\-/+=]+)", re.IGNORECASE),
-    # Generic long alphanumeric strings that might be secrets
-    re.compile(r"(?i)([a-zA-Z0-9._\-/+=]{32,})", re.IGNORECASE),
-]
+    r"(?i)(bearer\s+)[a-zA-Z0-9._\-/+=]{20,}",
+    # Standalone secrets in one alternation, so they share a single scan:
+    # OpenAI API keys, JWT tokens, and generic long alphanumeric strings
+    r"(?i)sk-[a-zA-Z0-9._\-/+=]{20,}|eyJ[a-zA-Z0-9._\-/+=]+|[a-zA-Z0-9._\-/+=]{32,}",
+)
+
+SECRET_PATTERNS: tuple[Any, ...] = tuple(
+    (re2 or re).compile(source) for source in _SECRET_PATTERN_SOURCES
+)
+
+
+def _build_secret_set() -> Any:
+    """Compile all secret patterns into one re2 automaton, if re2 is installed."""
+    if re2 is None:
+        return None
+    secret_set = re2.Set.SearchSet()
+    for source in _SECRET_PATTERN_SOURCES:
+        secret_set.Add(source)
+    secret_set.Compile()
+    return secret_set
+
+
+# With re2, one scan reports which patterns can match so the rest are skipped
+_SECRET_SET = _build_secret_set()
+
+# Literal anchors for each entry in _SECRET_PATTERN_SOURCES: a pattern can only
+# match lowercased text containing one of its anchors or, when a length is
+# given, an unbroken token at least that long (sk- plus 20 characters)
+_SECRET_PATTERN_ANCHORS: tuple[tuple[tuple[str, ...], int | None], ...] = (
+    (("api", "secret", "token", "password", "auth"), None),
+    (("bearer",), None),
+    (("eyj",), 23),
+)
+
+# Key fragments whose values are always masked, regardless of content
+SENSITIVE_KEYS: frozenset[str] = frozenset(
+    {
+        "api_key",
+        "secret",
+        "token",
+        "password",
+        "auth",
+        "credential",
+        "openai_api_key",
+        "deepgram_api_key",
+        "authorization",
+    }
+)
 
 
 def get_required_env_var(var_name: str) -> str:
@@ -65,6 +111,9 @@ def get_optional_env_var(var_name: str, default: str = "") -> str:
 def sanitize_for_logging(data: Any) -> Any:
     """Sanitize data to remove potential secrets before logging.
 
+    Nested containers are walked with an explicit stack, so deeply nested or
+    self-referencing data cannot exhaust the interpreter's recursion limit.
+
     Args:
         data: Data to sanitize (string, dict, list, etc.)
 
@@ -73,31 +122,86 @@ def sanitize_for_logging(data: Any) -> Any:
     """
     if isinstance(data, str):
         return _sanitize_string(data)
-    if isinstance(data, dict):
-        # Type hint for static analysis
-        typed_data: dict[str, Any] = cast("dict[str, Any]", data)
-        masked_dict = mask_sensitive_keys(typed_data)
-        return {
-            k: sanitize_for_logging(v) if not _is_masked_value(v) else v
-            for k, v in masked_dict.items()
-        }
-    if isinstance(data, (list, tuple)):
-        # Type hint for static analysis
-        typed_seq: Sequence[Any] = cast("Sequence[Any]", data)
-        return [sanitize_for_logging(item) for item in typed_seq]
-    return data
-
-
-def _is_masked_value(value: Any) -> bool:
-    """Check if a value is already masked."""
-    return isinstance(value, str) and value == "***REDACTED***"
+    if not isinstance(data, (dict, list, tuple)):
+        return data
+
+    # Sanitized copies keyed by id() of the source, so shared and cyclic
+    # containers are copied once and stay shared in the result
+    copies: dict[int, Any] = {}
+    pending: list[tuple[Any, Any]] = []
+    root = _sanitize_value(data, copies, pending)
+    while pending:
+        source, target = pending.pop()
+        if isinstance(source, dict):
+            typed_source: Mapping[str, Any] = cast("Mapping[str, Any]", source)
+            for key, value in typed_source.items():
+                target[key] = (
+                    "***REDACTED***"
+                    if _is_sensitive_key(key, SENSITIVE_KEYS)
+                    else _sanitize_value(value, copies, pending)
+                )
+        else:
+            typed_seq: Sequence[Any] = cast("Sequence[Any]", source)
+            target.extend(_sanitize_value(item, copies, pending) for item in typed_seq)
+    return root
+
+
+def _sanitize_value(
+    value: Any, copies: dict[int, Any], pending: list[tuple[Any, Any]]
+) -> Any:
+    """Sanitize a leaf, or return an empty copy of a container queued for filling."""
+    if isinstance(value, str):
+        return _sanitize_string(value)
+    if not isinstance(value, (dict, list, tuple)):
+        return value
+    copy = copies.get(id(value))
+    if copy is None:
+        copy = {} if isinstance(value, dict) else []
+        copies[id(value)] = copy
+        pending.append((value, copy))
+    return copy
+
+
+@functools.lru_cache(maxsize=1024)
+def _is_sensitive_key(key: str, sensitive_keys: frozenset[str]) -> bool:
+    """Check if a key name contains any of the sensitive key fragments.
+
+    Results are cached per key name, since logged payloads repeat the same
+    field names and the fragment scan only has to run once for each.
+    """
+    lowered = key.lower()
+    return any(sensitive_key in lowered for sensitive_key in sensitive_keys)
+
+
+def _candidate_patterns(text: str) -> Sequence[int]:
+    """Return the indices of the secret patterns that could match ``text``."""
+    if not text.isascii():
+        # IGNORECASE folds a few non-ASCII letters onto the ASCII anchors
+        return range(len(SECRET_PATTERNS))
+    lowered = text.lower()
+    longest_token: int | None = None
+    candidates: list[int] = []
+    for i, (anchors, min_token_len) in enumerate(_SECRET_PATTERN_ANCHORS):
+        if any(anchor in lowered for anchor in anchors):
+            candidates.append(i)
+        elif min_token_len is not None:
+            if longest_token is None:
+                longest_token = max(map(len, text.split()), default=0)
+            if longest_token >= min_token_len:
+                candidates.append(i)
+    return candidates
 
 
 def _sanitize_string(text: str) -> str:
     """Sanitize a string to mask potential secrets."""
+    indices = _candidate_patterns(text)
+    if indices and _SECRET_SET is not None:
+        indices = sorted(_SECRET_SET.Match(text) or ())
+
     result = text
-    for i, pattern in enumerate(SECRET_PATTERNS):
-        if i in {0, 1}:  # API key pattern with groups
+    for i in indices:
+        pattern = SECRET_PATTERNS[i]
+        if i in {0, 1}:  # Prefixed patterns keep the key or bearer prefix
             result = pattern.sub(r"\1***REDACTED***", result)
         else:  # Standalone secret patterns
             result = pattern.sub("***REDACTED***", result)
@@ -105,46 +209,62 @@ def _sanitize_string(text: str) -> str:
 
 
 def mask_sensitive_keys(
-    data: Mapping[str, Any], sensitive_keys: set[str] | None = None
+    data: Mapping[str, Any], sensitive_keys: Collection[str] | None = None
 ) -> dict[str, Any]:
     """Mask specific keys that are known to contain sensitive data.
 
     Args:
         data: Dictionary to sanitize
-        sensitive_keys: Set of keys to mask (default: common secret keys)
+        sensitive_keys: Key fragments to mask, matched case-insensitively
+            (default: common secret keys)
 
     Returns:
         Dictionary with sensitive values masked
     """
-    if sensitive_keys is None:
-        sensitive_keys = {
-            "api_key",
-            "secret",
-            "token",
-            "password",
-            "auth",
-            "credential",
-            "openai_api_key",
-            "deepgram_api_key",
-            "authorization",
-        }
+    keys = (
+        SENSITIVE_KEYS
+        if sensitive_keys is None
+        else frozenset(key.lower() for key in sensitive_keys)
+    )
+    return _mask_sensitive_keys(data, keys)
+
 
+def _mask_sensitive_keys(
+    data: Mapping[str, Any], sensitive_keys: frozenset[str]
+) -> dict[str, Any]:
+    """Mask sensitive keys using an already normalized fragment set."""
     result: dict[str, Any] = {}
     for key, value in data.items():
-        if any(sensitive_key in key.lower() for sensitive_key in sensitive_keys):
+        if _is_sensitive_key(key, sensitive_keys):
             result[key] = "***REDACTED***"
         elif isinstance(value, dict):
             # Type hint for static analysis
             nested_dict: Mapping[str, Any] = cast("Mapping[str, Any]", value)
-            result[key] = mask_sensitive_keys(nested_dict, sensitive_keys)
+            result[key] = _mask_sensitive_keys(nested_dict, sensitive_keys)
         else:
             result[key] = value
 
     return result
 
 
+def _sanitize_args(msg: str, args: tuple[Any, ...]) -> tuple[Any, ...]:
+    """Sanitize %-format arguments, dropping them if msg has no placeholder.
+
+    Arguments a message cannot interpolate would make logging fail to format
+    the record and print them raw to stderr, so they are never forwarded.
+    """
+    if not args or "%" not in msg:
+        return ()
+    return tuple(sanitize_for_logging(arg) for arg in args)
+
+
 class SecureLogger:
-    """A wrapper around standard logger that automatically sanitizes sensitive data."""
+    """A wrapper around standard logger that automatically sanitizes sensitive data.
+
+    Messages for disabled levels are dropped before sanitization, so they cost
+    no redaction work. Format arguments are sanitized when the message can
+    interpolate them and dropped otherwise.
+    """
 
     def __init__(self, logger: logging.Logger) -> None:
         """Initialize the SecureLogger with a standard logger.
@@ -156,20 +276,35 @@ class SecureLogger:
 
     def debug(self, msg: str, *args: Any, **kwargs: Any) -> None:
         """Log debug message with sanitization."""
-        self.logger.debug(sanitize_for_logging(msg), *args, **kwargs)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                sanitize_for_logging(msg), *_sanitize_args(msg, args), **kwargs
+            )
 
     def info(self, msg: str, *args: Any, **kwargs: Any) -> None:
         """Log info message with sanitization."""
-        self.logger.info(sanitize_for_logging(msg), *args, **kwargs)
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                sanitize_for_logging(msg), *_sanitize_args(msg, args), **kwargs
+            )
 
     def warning(self, msg: str, *args: Any, **kwargs: Any) -> None:
         """Log warning message with sanitization."""
-        self.logger.warning(sanitize_for_logging(msg), *args, **kwargs)
+        if self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning(
+                sanitize_for_logging(msg), *_sanitize_args(msg, args), **kwargs
+            )
 
     def error(self, msg: str, *args: Any, **kwargs: Any) -> None:
         """Log error message with sanitization."""
-        self.logger.error(sanitize_for_logging(msg), *args, **kwargs)
+        if self.logger.isEnabledFor(logging.ERROR):
+            self.logger.error(
+                sanitize_for_logging(msg), *_sanitize_args(msg, args), **kwargs
+            )
 
     def exception(self, msg: str, *args: Any, **kwargs: Any) -> None:
         """Log exception message with sanitization."""
-        self.logger.exception(sanitize_for_logging(msg), *args, **kwargs)
+        if self.logger.isEnabledFor(logging.ERROR):
+            self.logger.exception(
+                sanitize_for_logging(msg), *_sanitize_args(msg, args), **kwargs
+            )
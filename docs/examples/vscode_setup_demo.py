@@ -37,12 +37,6 @@ very_long_line = (
 # Print statement (should be logging) - FIXED
 import logging
 
-# Exception handling - FIXED
-try:
-    result = 1 / 0
-except ZeroDivisionError:
-    logging.warning("Division by zero attempted")
-
 # Global variable - FIXED
 global_var = 42
 
@@ -51,3 +45,11 @@ def modify_global() -> None:
     """Modify the global variable."""
     global global_var  # Keep global since it's at module level
     global_var = 100
+
+
+# Exception handling - FIXED
+if __name__ == "__main__":
+    try:
+        result = 1 / 0
+    except ZeroDivisionError:
+        logging.warning("Division by zero attempted")
@@ -6,10 +6,10 @@ Supports real-time streaming chat and optional Speech-to-Text.
 """
 
 import asyncio
+import concurrent.futures
 import contextlib
 import json
 import logging
-import queue
 import threading
 import uuid
 from typing import TYPE_CHECKING, Any
@@ -49,7 +49,9 @@ class TerminalChatClient:
         )
         self.connection_status = "Disconnected"
         self.current_message_id: str | None = None
-        self.message_queue: queue.Queue[tuple[str, str | None]] = queue.Queue()
+        # Filled from the keyboard and STT threads via _post_message
+        self.message_queue: asyncio.Queue[tuple[str, str | None]] = asyncio.Queue()
+        self._loop: asyncio.AbstractEventLoop | None = None
         self.stt_instance: Any | None = (
             None  # Using Any since DeepgramSTT might not be available
         )
@@ -154,6 +156,20 @@ class TerminalChatClient:
             if self.stt_instance:
                 self.stt_instance.resume_from_response_streaming()
 
+    def _post_message(self, message_type: str, user_input: str | None) -> None:
+        """Queue input for the main loop; safe to call from any thread."""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(
+                self.message_queue.put_nowait, (message_type, user_input)
+            )
+
+    def _on_stt_started(self, future: concurrent.futures.Future[None]) -> None:
+        """Disable STT if the background start failed."""
+        error = None if future.cancelled() else future.exception()
+        if future.cancelled() or error is not None:
+            logger.error("STT failed to start: %s", error or "cancelled")
+            self.stt_enabled = False
+
     def setup_stt(self) -> bool:
         """Setup Speech-to-Text if available and enabled."""
         if not stt_available or DeepgramSTT is None:
@@ -166,10 +182,13 @@ class TerminalChatClient:
 
             def utterance_callback(utterance: str) -> None:
                 """Handle complete utterances from STT."""
-                self.message_queue.put(("stt", utterance))
+                self._post_message("stt", utterance)
 
             self.stt_instance = DeepgramSTT(stt_config, utterance_callback)
-            self.stt_instance.start()
+            # Connect in the background; keyboard input works meanwhile
+            start_future = self.stt_instance.start()
+            if start_future is not None:
+                start_future.add_done_callback(self._on_stt_started)
             self.stt_enabled = True
         except (ImportError, AttributeError, KeyError):
             logger.exception("Failed to setup STT")
@@ -187,9 +206,9 @@ class TerminalChatClient:
                     user_input: str = input("> ").strip()
 
                 if user_input:
-                    self.message_queue.put(("keyboard", user_input))
+                    self._post_message("keyboard", user_input)
             except (EOFError, KeyboardInterrupt):
-                self.message_queue.put(("quit", None))
+                self._post_message("quit", None)
                 break
 
     def _process_user_input(self, message_type: str, user_input: str | None) -> bool:
@@ -220,15 +239,11 @@ class TerminalChatClient:
                 # Get next message (either from STT or keyboard)
                 message_type: str
                 user_input: str | None
-                message_type, user_input = self.message_queue.get(timeout=0.1)
+                message_type, user_input = await self.message_queue.get()
 
                 if not self._process_user_input(message_type, user_input):
                     break
 
-            except queue.Empty:
-                # Allow the event loop to process other tasks
-                await asyncio.sleep(0.1)
-                continue
             except KeyboardInterrupt:
                 break
             except Exception:
@@ -239,6 +254,8 @@ class TerminalChatClient:
 
     async def run(self) -> None:
         """Main chat loop."""
+        self._loop = asyncio.get_running_loop()
+
         # Connect to backend
         if not await self.connect():
             return
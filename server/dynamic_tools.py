@@ -11,6 +11,42 @@ from fastmcp import FastMCP
 
 logger = logging.getLogger(__name__)
 
+# Lookup tables for the analysis helpers, built once at import
+_SECTION_DESCRIPTIONS: dict[str, str] = {
+    "openai": (
+        "OpenAI API configuration including model, temperature, and token limits"
+    ),
+    "chatbot": (
+        "Chatbot behavior settings including conversation history and system prompts"
+    ),
+    "logging": (
+        "Logging configuration including level, file location, and enabling/disabling"
+    ),
+}
+
+_MODEL_INFO: dict[str, dict[str, Any]] = {
+    "gpt-4o-mini": {
+        "context_window": 128000,
+        "training_data": "2023-10",
+        "best_for": "fast responses",
+    },
+    "gpt-4o": {
+        "context_window": 128000,
+        "training_data": "2023-10",
+        "best_for": "complex reasoning",
+    },
+}
+_UNKNOWN_MODEL_INFO: dict[str, Any] = {
+    "context_window": "unknown",
+    "best_for": "general use",
+}
+
+_LOGGING_PERFORMANCE_IMPACTS: dict[str, str] = {
+    "DEBUG": "High I/O impact, detailed information",
+    "INFO": "Moderate I/O impact, standard information",
+    "WARNING": "Low I/O impact, only warnings and errors",
+}
+
 
 class DynamicToolManager:
     """Manages dynamic tool transformation based on configuration changes."""
@@ -181,45 +217,18 @@ class DynamicToolManager:
 
     def get_section_description(self, section: str) -> str:
         """Get description for a configuration section."""
-        descriptions = {
-            "openai": (
-                "OpenAI API configuration including model, temperature, and token limits"
-            ),
-            "chatbot": (
-                "Chatbot behavior settings including conversation history and system prompts"
-            ),
-            "logging": (
-                "Logging configuration including level, file location, and enabling/disabling"
-            ),
-        }
-        return descriptions.get(section, f"Configuration settings for {section}")
+        return _SECTION_DESCRIPTIONS.get(
+            section, f"Configuration settings for {section}"
+        )
 
     def get_model_info(self, model: str) -> dict[str, Any]:
         """Get information about OpenAI model capabilities."""
-        model_info = {
-            "gpt-4o-mini": {
-                "context_window": 128000,
-                "training_data": "2023-10",
-                "best_for": "fast responses",
-            },
-            "gpt-4o": {
-                "context_window": 128000,
-                "training_data": "2023-10",
-                "best_for": "complex reasoning",
-            },
-        }
-        return model_info.get(
-            model, {"context_window": "unknown", "best_for": "general use"}
-        )
+        # Copy so callers can't mutate the shared table
+        return dict(_MODEL_INFO.get(model, _UNKNOWN_MODEL_INFO))
 
     def get_logging_performance_impact(self, level: str) -> str:
         """Analyze performance impact of logging level."""
-        impacts = {
-            "DEBUG": "High I/O impact, detailed information",
-            "INFO": "Moderate I/O impact, standard information",
-            "WARNING": "Low I/O impact, only warnings and errors",
-        }
-        return impacts.get(level, "Unknown impact")
+        return _LOGGING_PERFORMANCE_IMPACTS.get(level, "Unknown impact")
 
     def get_logging_recommendations(self, level: str, *, enabled: bool) -> list[str]:
         """Get logging recommendations."""
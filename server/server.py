@@ -1,6 +1,11 @@
 import asyncio
+import copy
 import json
 import logging
+import re
+import uuid
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -23,18 +28,158 @@ logger = logging.getLogger(__name__)
 # Or: mcp run server/server.py (using MCP CLI)
 from server.dynamic_tools import DynamicToolManager
 
+
+@asynccontextmanager
+async def _lifespan(_server: FastMCP[Any]) -> AsyncIterator[None]:
+    """Run startup work on the event loop owned by mcp.run().
+
+    Transports that enter the lifespan once per session share one config
+    watcher, which stops only when the last active lifespan exits.
+    """
+    global _lifespan_users
+    if _dynamic_tool_manager is not None:
+        await _dynamic_tool_manager.transform_tools_based_on_config()
+        logger.info("Dynamic tools initialized")
+    _lifespan_users += 1
+    _start_config_watcher()
+    try:
+        yield
+    finally:
+        _lifespan_users -= 1
+        if _lifespan_users == 0:
+            _stop_config_watcher()
+
+
 # Create an MCP server
-mcp: FastMCP[Any] = FastMCP("config_aware_server")
+mcp: FastMCP[Any] = FastMCP("config_aware_server", lifespan=_lifespan)
+
+# Config file locations, resolved once for the process lifetime
+_SCRIPT_DIR = Path(__file__).parent.resolve()
+_DEFAULT_CONFIG_PATH = _SCRIPT_DIR / "default_backend_config.yaml"
 
 # Global configuration storage with proper type hints
 _config: dict[str, Any] = {}
 _default_config: dict[str, Any] = {}
-_config_file_path = Path(__file__).parent / "dynamic_backend_config.yaml"
+_default_config_yaml: bytes = b""  # Pre-rendered YAML of _default_config
+_config_file_path = _SCRIPT_DIR / "dynamic_backend_config.yaml"
 _config_version = 0
 _config_watcher_task: asyncio.Task[None] | None = (
     None  # Asyncio task for watching config file
 )
 _dynamic_tool_manager: DynamicToolManager | None = None  # DynamicToolManager instance
+_write_lock = asyncio.Lock()  # Orders config file writes
+_lifespan_users = 0  # Active lifespans sharing the config watcher
+
+# Prefer libyaml's C parser/emitter when PyYAML was built with it
+_Loader: type[yaml.SafeLoader] = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_Dumper: type[yaml.SafeDumper] = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Bare literals accepted by update_config, mapped without a JSON decode
+_LITERALS: dict[str, Any] = {
+    "true": True,
+    "false": False,
+    "null": None,
+    "True": True,
+    "False": False,
+    "None": None,
+}
+
+# A JSON number: ASCII digits, no leading zeros, "+" or "_", and no nan/inf
+_JSON_NUMBER = re.compile(r"-?(?:0|[1-9][0-9]*)(\.[0-9]+)?([eE][+-]?[0-9]+)?")
+
+
+def _resolve_config_path(filepath: str) -> Path:
+    """Resolve a config file path, treating relative paths as server-relative."""
+    path = Path(filepath)
+    return path if path.is_absolute() else _SCRIPT_DIR / path
+
+
+def _temp_path_for(path: Path) -> Path:
+    """Return a unique temp file path in the same directory as path."""
+    return path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+
+
+def _render_config(config: dict[str, Any]) -> bytes:
+    """Render configuration as YAML bytes in the on-disk format."""
+    rendered: bytes = yaml.dump(
+        config,
+        Dumper=_Dumper,
+        default_flow_style=False,
+        indent=2,
+        encoding="utf-8",
+    )
+    return rendered
+
+
+def _set_default_config(loaded: dict[str, Any]) -> None:
+    """Store defaults along with their pre-rendered YAML."""
+    global _default_config, _default_config_yaml
+    _default_config = loaded
+    _default_config_yaml = _render_config(loaded)
+
+
+def _fresh_defaults() -> dict[str, Any]:
+    """Return a deep copy of the defaults that is safe to mutate."""
+    return copy.deepcopy(_default_config)
+
+
+def _parse_config(content: bytes) -> dict[str, Any]:
+    """Parse YAML configuration bytes, returning an empty dict for empty files."""
+    loaded: dict[str, Any] | None = yaml.load(content, Loader=_Loader)  # noqa: S506
+    return loaded or {}
+
+
+def _parse_value(value: str) -> Any:  # noqa: ANN401
+    """Coerce a tool string argument into a bool, None, number, or JSON value.
+
+    Bare literals and JSON numbers are converted without going through the
+    JSON decoder; everything else is passed to json.loads, and kept as the raw
+    string if it is not valid JSON.
+    """
+    if value in _LITERALS:
+        return _LITERALS[value]
+    number = _JSON_NUMBER.fullmatch(value)
+    if number:
+        return float(value) if number.group(1) or number.group(2) else int(value)
+    try:
+        return json.loads(value)
+    except json.JSONDecodeError:
+        return value
+
+
+async def _write_config(config: dict[str, Any], path: Path) -> None:
+    """Atomically write a snapshot of configuration as YAML.
+
+    The config is deep-copied on the event loop before the first await, so
+    tools that mutate or replace it while the file is written can't leak into
+    it; the YAML is then rendered in a worker thread.
+    """
+    snapshot = copy.deepcopy(config)
+    async with _write_lock:
+        content = await asyncio.to_thread(_render_config, snapshot)
+        await _replace_file(content, path)
+
+
+async def _write_config_bytes(content: bytes, path: Path) -> None:
+    """Atomically write pre-rendered YAML bytes to path."""
+    async with _write_lock:
+        await _replace_file(content, path)
+
+
+async def _replace_file(content: bytes, path: Path) -> None:
+    """Replace path with content through a temp file; callers hold _write_lock.
+
+    Writes are serialized, so they land on disk in the order they started and
+    a slow older write can't replace a newer file.
+    """
+    tmp_path = _temp_path_for(path)
+    try:
+        async with aiofiles.open(tmp_path, "wb") as f:
+            await f.write(content)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    await aiofiles.os.replace(tmp_path, path)
 
 
 async def _async_reload_config() -> None:
@@ -42,9 +187,9 @@ async def _async_reload_config() -> None:
     global _config, _config_version, _dynamic_tool_manager
     try:
         if await aiofiles.os.path.exists(_config_file_path):
-            async with aiofiles.open(_config_file_path) as f:
+            async with aiofiles.open(_config_file_path, "rb") as f:
                 content = await f.read()
-            loaded_config: dict[str, Any] = yaml.safe_load(content) or {}
+            loaded_config: dict[str, Any] = _parse_config(content)
             if loaded_config:
                 _config = loaded_config
                 _config_version += 1
@@ -113,21 +258,22 @@ async def get_config_version() -> str:
 
 
 @mcp.tool()
-async def get_config(section: str | None = None) -> str:
+async def get_config(section: str | None = None) -> dict[str, Any] | str:
     """Get current configuration. Available sections: 'openai', 'chatbot', 'logging'.
     If section parameter is provided, returns only that section.
     If no section provided, returns all configuration.
     """
+    # Dicts are serialized to JSON once by FastMCP on the way out
     if section:
         return (
-            json.dumps({section: _config.get(section)}, indent=2)
+            {section: _config.get(section)}
             if section in _config
             else (
                 f"Configuration section '{section}' not found. "
                 f"Available sections: {list(_config.keys())}"
             )
         )
-    return json.dumps(_config, indent=2)
+    return _config
 
 
 @mcp.tool()
@@ -136,7 +282,7 @@ async def update_config(section: str, key: str, value: str) -> str:
     max_tokens, top_p, presence_penalty, frequency_penalty), 'chatbot'
     (system_prompt, max_conversation_history, clear_history_on_exit), 'logging'
     (enabled, level, log_file). Use format: section='openai', key='temperature',
-    value='0.7'. Value will be parsed as JSON if possible.
+    value='0.7'. Value will be parsed as a literal or JSON if possible.
     """
     global _dynamic_tool_manager
     if section not in _config:
@@ -151,12 +297,7 @@ async def update_config(section: str, key: str, value: str) -> str:
             f"Available keys: {list(_config[section].keys())}"
         )
 
-    # Try to parse the value as JSON for proper type conversion
-    try:
-        parsed_value = json.loads(value)
-    except json.JSONDecodeError:
-        # If not valid JSON, treat as string
-        parsed_value = value
+    parsed_value = _parse_value(value)
 
     old_value = _config[section][key]
     _config[section][key] = parsed_value
@@ -167,8 +308,7 @@ async def update_config(section: str, key: str, value: str) -> str:
 
     # Auto-save the configuration to maintain persistence (async)
     try:
-        async with aiofiles.open(_config_file_path, "w") as f:
-            await f.write(yaml.dump(_config, default_flow_style=False, indent=2))
+        await _write_config(_config, _config_file_path)
         save_status = f" (saved to server config, version {_config_version})"
     except (OSError, FileNotFoundError, PermissionError) as e:
         save_status = f" (warning: file system error - {e!s})"
@@ -186,14 +326,8 @@ async def update_config(section: str, key: str, value: str) -> str:
 async def save_config(filepath: str = "dynamic_backend_config.yaml") -> str:
     """Save current configuration to a YAML file."""
     try:
-        # Use Path objects consistently and simplify path handling
-        path = (
-            Path(filepath)
-            if Path(filepath).is_absolute()
-            else _config_file_path.parent / filepath
-        )
-        async with aiofiles.open(path, "w") as f:
-            await f.write(yaml.dump(_config, default_flow_style=False, indent=2))
+        path = _resolve_config_path(filepath)
+        await _write_config(_config, path)
         return f"Configuration saved to {path}"
     except (OSError, FileNotFoundError, PermissionError) as e:
         return f"File system error saving configuration: {e}"
@@ -208,17 +342,12 @@ async def load_config(filepath: str = "dynamic_backend_config.yaml") -> str:
     """Load configuration from a YAML file."""
     global _config, _config_version
     try:
-        # Use Path objects consistently
-        path = (
-            Path(filepath)
-            if Path(filepath).is_absolute()
-            else _config_file_path.parent / filepath
-        )
+        path = _resolve_config_path(filepath)
 
         if await aiofiles.os.path.exists(path):
-            async with aiofiles.open(path) as f:
+            async with aiofiles.open(path, "rb") as f:
                 content = await f.read()
-            loaded_config: dict[str, Any] = yaml.safe_load(content) or {}
+            loaded_config: dict[str, Any] = _parse_config(content)
             if loaded_config:
                 _config = loaded_config
                 _config_version += 1
@@ -238,13 +367,12 @@ async def reset_config() -> str:
     """Reset configuration to default values."""
     global _config, _config_version
     if _default_config:
-        _config = _default_config.copy()
+        _config = _fresh_defaults()
         _config_version += 1
 
         # Auto-save the reset config
         try:
-            async with aiofiles.open(_config_file_path, "w") as f:
-                await f.write(yaml.dump(_config, default_flow_style=False, indent=2))
+            await _write_config_bytes(_default_config_yaml, _config_file_path)
             return (
                 f"Configuration reset to default values from default_backend_config.yaml "
                 f"(version {_config_version})"
@@ -266,7 +394,7 @@ async def load_defaults() -> str:
     """Load default configuration from default_backend_config.yaml."""
     global _config, _config_version
     if await _async_load_default_config():
-        _config = _default_config.copy()
+        _config = _fresh_defaults()
         _config_version += 1
         return (
             f"Default configuration loaded from default_backend_config.yaml "
@@ -276,7 +404,7 @@ async def load_defaults() -> str:
 
 
 @mcp.tool()
-async def list_config_keys(section: str | None = None) -> str:
+async def list_config_keys(section: str | None = None) -> dict[str, list[str]] | str:
     """List all configuration keys. If section is provided, lists keys in that section only."""
     if section:
         return (
@@ -288,9 +416,7 @@ async def list_config_keys(section: str | None = None) -> str:
             )
         )
 
-    return json.dumps(
-        {sec: list(data.keys()) for sec, data in _config.items()}, indent=2
-    )
+    return {sec: list(data.keys()) for sec, data in _config.items()}
 
 
 @mcp.tool()
@@ -326,15 +452,14 @@ async def calculate(operation: str, a: float, b: float) -> str:
 
 async def _async_load_default_config() -> bool:
     """Async load default configuration from default_backend_config.yaml."""
-    global _default_config
     try:
-        default_file = _config_file_path.parent / "default_backend_config.yaml"
+        default_file = _DEFAULT_CONFIG_PATH
         if await aiofiles.os.path.exists(default_file):
-            async with aiofiles.open(default_file) as f:
+            async with aiofiles.open(default_file, "rb") as f:
                 content = await f.read()
-            loaded: dict[str, Any] = yaml.safe_load(content) or {}
+            loaded: dict[str, Any] = _parse_config(content)
             if loaded:
-                _default_config = loaded
+                _set_default_config(loaded)
                 logger.info("Loaded default config from %s", default_file)
                 return True
     except (OSError, FileNotFoundError, PermissionError) as e:
@@ -349,14 +474,12 @@ async def _async_load_default_config() -> bool:
 # Sync fallback for startup
 def _load_default_config() -> bool:
     """Sync load default configuration - used only during startup."""
-    global _default_config
     try:
-        default_file = _config_file_path.parent / "default_backend_config.yaml"
+        default_file = _DEFAULT_CONFIG_PATH
         if default_file.exists():
-            with open(default_file) as f:
-                loaded: dict[str, Any] = yaml.safe_load(f) or {}
+            loaded: dict[str, Any] = _parse_config(default_file.read_bytes())
             if loaded:
-                _default_config = loaded
+                _set_default_config(loaded)
                 logger.info("Loaded default config from %s", default_file)
                 return True
     except (OSError, FileNotFoundError, PermissionError) as e:
@@ -376,7 +499,7 @@ if __name__ == "__main__":
     # Load dynamic config
     try:
         if _config_file_path.exists():
-            loaded: dict[str, Any] = yaml.safe_load(_config_file_path.read_text()) or {}
+            loaded: dict[str, Any] = _parse_config(_config_file_path.read_bytes())
             if loaded:
                 _config = loaded
                 _config_version = 1
@@ -387,36 +510,25 @@ if __name__ == "__main__":
                 )
             else:
                 logger.info("Config empty; using defaults")
-                _config = _default_config.copy()
+                _config = _fresh_defaults()
                 _config_version = 1
         else:
             logger.info("No config file; using defaults")
-            _config = _default_config.copy()
+            _config = _fresh_defaults()
             _config_version = 1
     except (OSError, FileNotFoundError, PermissionError) as e:
         logger.error("File system error loading config: %s; using defaults", e)
-        _config = _default_config.copy()
+        _config = _fresh_defaults()
         _config_version = 1
     except yaml.YAMLError as e:
         logger.error("YAML parsing error loading config: %s; using defaults", e)
-        _config = _default_config.copy()
+        _config = _fresh_defaults()
         _config_version = 1
     except Exception as e:
         logger.exception("Unexpected error loading config: %s; using defaults", e)
-        _config = _default_config.copy()
+        _config = _fresh_defaults()
         _config_version = 1
 
-    # Start watcher
-    _start_config_watcher()
-
-    # Initialize dynamic tools manager and schedule initial transform
+    # Initial tool transform and config watcher run in the server lifespan
     _dynamic_tool_manager = DynamicToolManager(mcp, _config)
-    loop = asyncio.get_event_loop()
-    loop.create_task(_dynamic_tool_manager.transform_tools_based_on_config())
-    logger.info("Dynamic tool initialization scheduled!")
-
-    try:
-        mcp.run()
-    finally:
-        # Clean up the config watcher on exit
-        _stop_config_watcher()
+    mcp.run()
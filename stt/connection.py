@@ -21,6 +21,40 @@ DeepgramConnection = Any
 DeepgramEventHandler = Any
 STTConfig = dict[str, Any]
 
+# Audio format shared by LiveOptions and the Microphone capture stream.
+# 8192 frames of linear16 mono is ~0.5s per PortAudio callback, so each
+# callback's bytes are forwarded to send() as-is rather than copied into a
+# pooled buffer.
+_SAMPLE_RATE = 16000
+_CHANNELS = 1
+_CHUNK_FRAMES = 8192
+
+# Captured chunks buffered between PortAudio and the websocket (~16s of audio)
+_AUDIO_QUEUE_SIZE = 32
+
+# Deepgram events paired with the handler attribute that services them
+_DG_EVENT_MAP: tuple[tuple[Any, str], ...] = (
+    (LiveTranscriptionEvents.Open, "on_open"),
+    (LiveTranscriptionEvents.Transcript, "on_transcript"),
+    (LiveTranscriptionEvents.Metadata, "on_metadata"),
+    (LiveTranscriptionEvents.SpeechStarted, "on_speech_started"),
+    (LiveTranscriptionEvents.UtteranceEnd, "on_utterance_end"),
+    (LiveTranscriptionEvents.Close, "on_close"),
+    (LiveTranscriptionEvents.Error, "on_error"),
+)
+
+
+def _create_microphone() -> Microphone:
+    """Create the capture stream; blocks while PortAudio probes audio backends."""
+    return Microphone(rate=_SAMPLE_RATE, chunk=_CHUNK_FRAMES, channels=_CHANNELS)
+
+
+async def _discard_microphone(mic_task: asyncio.Task[Microphone]) -> None:
+    """Wait for a pending microphone and close it, ignoring any creation error."""
+    with contextlib.suppress(Exception):
+        microphone = await mic_task
+        microphone.finish()
+
 
 class DeepgramConnectionError(Exception):
     """Custom exception for Deepgram connection errors."""
@@ -68,25 +102,31 @@ class DeepgramConnectionManager:
         self.stt_config: STTConfig = stt_config
         self.logger: logging.Logger = logger
 
+        # Live options depend only on stt_config, so build them once
+        self._options = LiveOptions(
+            model=stt_config.get("model", "nova-2"),
+            language=stt_config.get("language", "en-US"),
+            smart_format=True,
+            encoding="linear16",
+            channels=_CHANNELS,
+            sample_rate=_SAMPLE_RATE,
+            interim_results=True,
+            utterance_end_ms=stt_config.get("utterance_end_ms", 1000),
+            vad_events=True,
+        )
+
         # Initialize Deepgram client (API key not stored)
         self.deepgram: DeepgramClient = DeepgramClient(api_key)
         self.dg_connection: DeepgramConnection | None = None
         self.microphone: Microphone | None = None
 
-        # Event loop management
-        self.dg_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
-        self.dg_thread: threading.Thread = threading.Thread(
-            target=self._run_dg_loop, daemon=True
-        )
-        self.dg_thread.start()
+        # Audio handoff from the PortAudio thread to the websocket sender
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._audio_queue: asyncio.Queue[bytes] | None = None
+        self._pump_task: asyncio.Task[None] | None = None
 
         # Cleanup state
-        self._cleanup_done: bool = False
-
-    def _run_dg_loop(self) -> None:
-        """Run the dedicated asyncio event loop for Deepgram operations."""
-        asyncio.set_event_loop(self.dg_loop)
-        self.dg_loop.run_forever()
+        self._cleanup_event = threading.Event()
 
     def _raise_connection_error(self, message: str) -> None:
         """Raise a connection error with the given message."""
@@ -98,62 +138,37 @@ class DeepgramConnectionManager:
         """Start live transcription connection."""
         try:
             # Create live connection
-            self.dg_connection = self.deepgram.listen.asyncwebsocket.v("1")
+            conn = self.deepgram.listen.asyncwebsocket.v("1")
+            self.dg_connection = conn
 
             # Set up event handlers
-            if self.dg_connection:
-                self.dg_connection.on(
-                    LiveTranscriptionEvents.Open, event_handlers.on_open
-                )
-                self.dg_connection.on(
-                    LiveTranscriptionEvents.Transcript, event_handlers.on_transcript
-                )
-                self.dg_connection.on(
-                    LiveTranscriptionEvents.Metadata, event_handlers.on_metadata
-                )
-                self.dg_connection.on(
-                    LiveTranscriptionEvents.SpeechStarted,
-                    event_handlers.on_speech_started,
-                )
-                self.dg_connection.on(
-                    LiveTranscriptionEvents.UtteranceEnd,
-                    event_handlers.on_utterance_end,
-                )
-                self.dg_connection.on(
-                    LiveTranscriptionEvents.Close, event_handlers.on_close
-                )
-                self.dg_connection.on(
-                    LiveTranscriptionEvents.Error, event_handlers.on_error
-                )
-
-            # Configure options
-            options = LiveOptions(
-                model=self.stt_config.get("model", "nova-2"),
-                language=self.stt_config.get("language", "en-US"),
-                smart_format=True,
-                encoding="linear16",
-                channels=1,
-                sample_rate=16000,
-                interim_results=True,
-                utterance_end_ms=self.stt_config.get("utterance_end_ms", 1000),
-                vad_events=True,
-            )
+            if conn:
+                for event, handler_name in _DG_EVENT_MAP:
+                    conn.on(event, getattr(event_handlers, handler_name))
 
             # Start connection
-            if not self.dg_connection:
+            if not conn:
                 self._raise_connection_error("Failed to create Deepgram connection")
 
-            started: bool | asyncio.Future[bool] = await self.dg_connection.start(  # type: ignore[attr-defined]
-                options
-            )
+            # Initialize PortAudio off-loop while the websocket handshake runs
+            mic_task = asyncio.create_task(asyncio.to_thread(_create_microphone))
+            try:
+                started: bool | asyncio.Future[bool] = await conn.start(self._options)
+            except BaseException:
+                # Report the start failure, not a microphone error behind it
+                await _discard_microphone(mic_task)
+                raise
             if not started:
+                await _discard_microphone(mic_task)
                 self._raise_connection_error("Failed to start Deepgram connection")
+            self.microphone = await mic_task
 
-            # Set up microphone
-            if self.dg_connection:
-                self.microphone = Microphone(self.dg_connection.send)  # type: ignore[attr-defined]
-            if self.microphone:
-                self.microphone.start()
+            # Stream audio as soon as the connection is up
+            self._loop = asyncio.get_running_loop()
+            self._audio_queue = asyncio.Queue(maxsize=_AUDIO_QUEUE_SIZE)
+            self._pump_task = asyncio.create_task(self._pump_audio(conn))
+            self.microphone.set_callback(self._on_audio)
+            self.microphone.start()
 
             self.logger.info("🎤 Deepgram live transcription started")
 
@@ -163,6 +178,43 @@ class DeepgramConnectionManager:
         else:
             return self.dg_connection
 
+    def _on_audio(self, chunk: bytes) -> None:
+        """Hand a captured chunk to the event loop (runs on the PortAudio thread)."""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._enqueue_audio, chunk)
+
+    def _enqueue_audio(self, chunk: bytes) -> None:
+        """Queue a chunk for sending, dropping the oldest one if the queue is full."""
+        queue = self._audio_queue
+        if queue is None:
+            return
+        if queue.full():
+            queue.get_nowait()
+            self.logger.debug("Audio queue full; dropped oldest chunk")
+        queue.put_nowait(chunk)
+
+    async def _pump_audio(self, conn: DeepgramConnection) -> None:
+        """Forward queued audio to the Deepgram websocket."""
+        queue = self._audio_queue
+        if queue is None:
+            return
+        while True:
+            chunk = await queue.get()
+            try:
+                await conn.send(chunk)
+            except (RuntimeError, OSError, ConnectionError) as e:
+                self.logger.debug("Error sending audio (ignoring): %s", e)
+
+    async def _stop_audio_pump(self) -> None:
+        """Cancel the audio pump and drop any unsent audio."""
+        if self._pump_task is not None:
+            self._pump_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._pump_task
+            self._pump_task = None
+        self._audio_queue = None
+        self._loop = None
+
     async def finish_connection(self) -> None:
         """Finish transcription and cleanup connections."""
         try:
@@ -172,17 +224,17 @@ class DeepgramConnectionManager:
                     self.microphone.finish()
                 self.microphone = None
 
+            # Stop forwarding audio before closing the connection
+            await self._stop_audio_pump()
+
             # Close connection gracefully
             if self.dg_connection:
-                try:
-                    finish_result: bool | asyncio.Future[bool] = (
-                        self.dg_connection.finish()
-                    )
-                    if isinstance(finish_result, asyncio.Future):
-                        await asyncio.wait_for(finish_result, timeout=2.0)
-                    # If it's a bool, no need to await
-                except (TimeoutError, RuntimeError, OSError, AttributeError):
-                    pass  # Ignore connection cleanup errors
+                # finish() drains and closes the socket; no fixed delay needed
+                # Ignore connection cleanup errors
+                with contextlib.suppress(
+                    TimeoutError, RuntimeError, OSError, AttributeError
+                ):
+                    await asyncio.wait_for(self.dg_connection.finish(), timeout=2.0)
                 self.dg_connection = None
 
             self.logger.info("🛑 Live transcription finished")
@@ -192,18 +244,11 @@ class DeepgramConnectionManager:
 
     def cleanup(self) -> None:
         """Clean up connection resources."""
-        if hasattr(self, "_cleanup_done") and self._cleanup_done:
+        if self._cleanup_event.is_set():
             return
 
         self.logger.info("Cleaning up connection...")
-        self._cleanup_done = True
-
-        # Stop the event loop
-        if hasattr(self, "dg_loop") and self.dg_loop.is_running():
-            with contextlib.suppress(RuntimeError):
-                self.dg_loop.call_soon_threadsafe(self.dg_loop.stop)
-            if hasattr(self, "dg_thread"):
-                self.dg_thread.join(timeout=2.0)
+        self._cleanup_event.set()
 
         self.logger.info("Connection cleanup complete")
 
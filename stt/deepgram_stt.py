@@ -4,14 +4,22 @@ Refactored following 2025 best practices with proper separation of concerns.
 """
 
 import asyncio
+import concurrent.futures
+import contextlib
 import logging
 import os
+import threading
 import types
 from collections.abc import Callable
 from typing import Any
 
 from dotenv import load_dotenv
 
+try:
+    import uvloop
+except ImportError:  # Not available on Windows; fall back to the default loop
+    uvloop = None  # type: ignore[assignment]
+
 from backend.exceptions import DeepgramSTTError
 from backend.utils import log_and_wrap_error
 
@@ -58,9 +66,42 @@ class DeepgramSTT:
         )
         self.keepalive_manager = KeepAliveManager(self.logger, stt_config)
 
+        # Loop the live connection runs on, captured when transcription starts
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+        # Background loop backing the sync facade, only started on first use
+        self._sync_loop: asyncio.AbstractEventLoop | None = None
+        self._sync_thread: threading.Thread | None = None
+
+        # Pending start() handed back to callers, see await_ready()
+        self._start_future: concurrent.futures.Future[None] | None = None
+
+        # Set once cleanup has run so repeated calls are no-ops
+        self._cleanup_event = threading.Event()
+
+    def _get_sync_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the background event loop used by the sync wrapper methods."""
+        if self._sync_loop is None:
+            self._sync_loop = (
+                uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+            )
+            self._sync_thread = threading.Thread(
+                target=self._run_sync_loop, daemon=True
+            )
+            self._sync_thread.start()
+        return self._sync_loop
+
+    def _run_sync_loop(self) -> None:
+        """Run the background event loop for the sync wrapper methods."""
+        if self._sync_loop is not None:
+            asyncio.set_event_loop(self._sync_loop)
+            self._sync_loop.run_forever()
+
     async def start_live_transcription(self) -> None:
         """Start live transcription using modular components."""
         try:
+            self._loop = asyncio.get_running_loop()
+
             # Start connection through connection manager
             await self.connection_manager.start_connection(self.event_handlers)
 
@@ -110,10 +151,11 @@ class DeepgramSTT:
 
         # Start keepalive with current connection
         dg_connection = self.connection_manager.get_connection()
-        if dg_connection:
-            asyncio.run_coroutine_threadsafe(
+        if dg_connection and self._loop is not None:
+            # Fire-and-forget: the keepalive manager keeps its own task handle
+            self._loop.call_soon_threadsafe(
+                self._loop.create_task,
                 self.keepalive_manager.start_keepalive(dg_connection),
-                self.connection_manager.dg_loop,
             )
 
     def resume_from_response_streaming(self) -> None:
@@ -124,19 +166,40 @@ class DeepgramSTT:
         self.event_handlers.set_streaming_response(is_streaming=False)
         self.keepalive_manager.resume_from_response_streaming()
 
-    # Sync wrapper methods using dedicated event loop
-    def start(self) -> None:
-        """Start the STT service."""
+    # Sync wrapper methods using a lazily started background event loop
+    def start(self) -> concurrent.futures.Future[None] | None:
+        """Start the STT service without waiting for the connection.
+
+        Returns:
+            Future that completes once live transcription has started, or None
+            if the service is already running. Call await_ready() to block.
+        """
         if self.is_running:
             self.logger.warning("STT is already running")
-            return
+            return None
+        if self._start_future is not None and not self._start_future.done():
+            return self._start_future  # Start already in flight
 
         self.logger.info("Starting live transcription...")
-        future = asyncio.run_coroutine_threadsafe(
-            self.start_live_transcription(), self.connection_manager.dg_loop
+        self._start_future = asyncio.run_coroutine_threadsafe(
+            self.start_live_transcription(), self._get_sync_loop()
         )
+        return self._start_future
+
+    def await_ready(self, timeout: float = 10) -> None:
+        """Block until a pending start() has connected.
+
+        Args:
+            timeout: Seconds to wait for the connection to start
+
+        Raises:
+            DeepgramSTTError: If start() was not called or the start failed
+        """
+        if self._start_future is None:
+            msg = "STT service was not started"
+            raise DeepgramSTTError(msg)
         try:
-            future.result(timeout=10)  # Wait up to 10 seconds for start
+            self._start_future.result(timeout=timeout)
         except (RuntimeError, OSError, ConnectionError, ValueError, TimeoutError) as e:
             wrapped_error = log_and_wrap_error(
                 e,
@@ -149,12 +212,12 @@ class DeepgramSTT:
 
     def stop(self) -> None:
         """Stop the STT service."""
-        if not self.is_running:
+        if not self.is_running or self._loop is None:
             return  # Silently return if already stopped
 
         self.logger.info("Stopping live transcription...")
         future = asyncio.run_coroutine_threadsafe(
-            self.finish_transcription(), self.connection_manager.dg_loop
+            self.finish_transcription(), self._loop
         )
         try:
             future.result(timeout=3)  # Shorter timeout for faster shutdown
@@ -163,11 +226,11 @@ class DeepgramSTT:
 
     def cleanup(self) -> None:
         """Clean up resources."""
-        if hasattr(self, "_cleanup_done") and self._cleanup_done:
+        if self._cleanup_event.is_set():
             return  # Prevent duplicate cleanup
 
         self.logger.info("Cleaning up STT...")
-        self._cleanup_done = True
+        self._cleanup_event.set()
 
         if self.is_running:
             self.stop()
@@ -175,10 +238,18 @@ class DeepgramSTT:
         # Clean up connection manager
         self.connection_manager.cleanup()
 
+        # Stop the sync facade's background loop if it was ever started
+        if self._sync_loop is not None and self._sync_loop.is_running():
+            with contextlib.suppress(RuntimeError):
+                self._sync_loop.call_soon_threadsafe(self._sync_loop.stop)
+            if self._sync_thread is not None:
+                self._sync_thread.join(timeout=2.0)
+
         self.logger.info("STT cleanup complete")
 
     def __enter__(self) -> "DeepgramSTT":
         self.start()
+        self.await_ready()
         return self
 
     def __exit__(
@@ -22,7 +22,7 @@ class STTEventHandlers:
         """
         self.logger = logger
         self.utterance_callback = utterance_callback
-        self.is_final_transcript: list[str] = []
+        self._utterance_parts: list[str] = []
         self.is_streaming_response = False
         self.is_running = False
 
@@ -32,61 +32,70 @@ class STTEventHandlers:
 
     async def on_transcript(self, _client: Any, result: Any) -> None:  # noqa: ANN401
         """Transcript received callback - main processing logic."""
-        try:
-            self.logger.debug("🎵 Raw result received: %s", result)
+        # Skip processing during KeepAlive mode
+        if self.is_streaming_response:
+            return
 
-            # Skip processing during KeepAlive mode
-            if self.is_streaming_response:
+        # Check the level once per event rather than before each debug call
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        try:
+            if debug:
+                self.logger.debug("🎵 Raw result received: %s", result)
+
+            # Resolve the top alternative once; results without one are skipped
+            alternative = result.channel.alternatives[0]
+            transcript = alternative.transcript
+            if not transcript or transcript.isspace():
+                self.logger.debug("🔇 Empty transcript received")
                 return
 
-            # Handle unknown object types safely
-            if hasattr(result, "channel") and hasattr(result.channel, "alternatives"):
-                transcript = result.channel.alternatives[0].transcript
-                if transcript.strip():
-                    if hasattr(result, "is_final") and result.is_final:
-                        confidence = getattr(
-                            result.channel.alternatives[0], "confidence", "N/A"
-                        )
-                        self.logger.debug(
-                            "✔️ FINAL: %s (Confidence: %s)", transcript, confidence
-                        )
-                        self.is_final_transcript.append(transcript)
-                    else:
-                        self.logger.debug("⚡ INTERIM: %s", transcript)
-                else:
-                    self.logger.debug("🔇 Empty transcript received")
+            if result.is_final:
+                self._utterance_parts.append(transcript)
+                if debug:
+                    self.logger.debug(
+                        "✔️ FINAL: %s (Confidence: %s)",
+                        transcript,
+                        getattr(alternative, "confidence", "N/A"),
+                    )
             else:
-                self.logger.debug("🔇 Invalid result structure received")
+                self.logger.debug("⚡ INTERIM: %s", transcript)
 
+        except (AttributeError, IndexError):
+            self.logger.debug("🔇 Invalid result structure received")
         except Exception:
             self.logger.exception("Error processing transcript")
-            self.logger.debug("🐛 Full result object: %s", result)
+            if debug:
+                self.logger.debug("🐛 Full result object: %s", result)
 
     async def on_metadata(self, _client: Any, metadata: Any) -> None:  # noqa: ANN401
         """Metadata received callback."""
-        self.logger.debug("📊 Metadata: %s", metadata)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("📊 Metadata: %s", metadata)
 
     async def on_speech_started(
         self, _client: Any, speech_started: Any  # noqa: ANN401
     ) -> None:
         """Speech started callback."""
-        self.logger.debug("🗣️ Speech started: %s", speech_started)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("🗣️ Speech started: %s", speech_started)
 
     async def on_utterance_end(
         self, _client: Any, utterance_end: Any  # noqa: ANN401
     ) -> None:
         """Utterance end callback - triggers final processing."""
         try:
-            self.logger.debug("🔚 Utterance end: %s", utterance_end)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("🔚 Utterance end: %s", utterance_end)
 
             # Skip processing during KeepAlive mode
             if self.is_streaming_response:
                 return
 
-            if len(self.is_final_transcript) > 0:
-                complete_utterance = " ".join(self.is_final_transcript)
+            if self._utterance_parts:
+                complete_utterance = " ".join(self._utterance_parts)
                 self.logger.info("🎯 COMPLETE UTTERANCE: %s", complete_utterance)
-                self.is_final_transcript = []
+                # Reuse the buffer for the next utterance
+                self._utterance_parts.clear()
 
                 # Trigger callback with complete utterance
                 try:
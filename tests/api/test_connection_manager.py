@@ -1,5 +1,7 @@
 """Tests for ConnectionManager service."""
 
+from collections.abc import Callable
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -17,18 +19,24 @@ class TestConnectionManager:
         return ConnectionManager()
 
     @pytest.fixture
-    def mock_websocket(self) -> MagicMock:
-        """Create a mock WebSocket for testing."""
-        websocket = MagicMock(spec=WebSocket)
-        websocket.accept = AsyncMock()
-        websocket.send_text = AsyncMock()
-        return websocket
-
-    @pytest.mark.asyncio
+    def ws_factory(self) -> Callable[..., MagicMock]:
+        """Create a factory for spec'd mock WebSockets."""
+
+        def _make(**send_text_kwargs: Any) -> MagicMock:
+            websocket = MagicMock(spec=WebSocket)
+            websocket.accept = AsyncMock()
+            websocket.send_text = AsyncMock(**send_text_kwargs)
+            return websocket
+
+        return _make
+
     async def test_connect_websocket(
-        self, connection_manager: ConnectionManager, mock_websocket: MagicMock
+        self,
+        connection_manager: ConnectionManager,
+        ws_factory: Callable[..., MagicMock],
     ) -> None:
         """Test connecting a WebSocket."""
+        mock_websocket = ws_factory()
         client_id: str = await connection_manager.connect(mock_websocket)
 
         # Verify WebSocket was accepted
@@ -39,11 +47,15 @@ class TestConnectionManager:
         assert connection_manager.get_connection_count() == 1
         assert client_id in connection_manager.get_client_ids()
 
-    def test_disconnect_client(self, connection_manager: ConnectionManager) -> None:
+    def test_disconnect_client(
+        self,
+        connection_manager: ConnectionManager,
+        ws_factory: Callable[..., MagicMock],
+    ) -> None:
         """Test disconnecting a client."""
         # Add a mock connection
         client_id: str = "test-client-id"
-        mock_websocket: MagicMock = MagicMock()
+        mock_websocket = ws_factory()
         connection_manager.active_connections[client_id] = mock_websocket
 
         # Disconnect
@@ -53,26 +65,28 @@ class TestConnectionManager:
         assert client_id not in connection_manager.active_connections
         assert connection_manager.get_connection_count() == 0
 
-    @pytest.mark.asyncio
     async def test_send_personal_message_success(
-        self, connection_manager: ConnectionManager, mock_websocket: MagicMock
+        self,
+        connection_manager: ConnectionManager,
+        ws_factory: Callable[..., MagicMock],
     ) -> None:
         """Test sending a personal message successfully."""
         client_id: str = "test-client-id"
+        mock_websocket = ws_factory()
         connection_manager.active_connections[client_id] = mock_websocket
 
         await connection_manager.send_personal_message("Hello", client_id)
 
         mock_websocket.send_text.assert_called_once_with("Hello")
 
-    @pytest.mark.asyncio
     async def test_send_personal_message_removes_broken_connection(
-        self, connection_manager: ConnectionManager
+        self,
+        connection_manager: ConnectionManager,
+        ws_factory: Callable[..., MagicMock],
     ) -> None:
         """Test that broken connections are removed when sending fails."""
         client_id: str = "test-client-id"
-        mock_websocket: MagicMock = MagicMock()
-        mock_websocket.send_text = AsyncMock(side_effect=Exception("Connection broken"))
+        mock_websocket = ws_factory(side_effect=Exception("Connection broken"))
         connection_manager.active_connections[client_id] = mock_websocket
 
         await connection_manager.send_personal_message("Hello", client_id)
@@ -80,7 +94,11 @@ class TestConnectionManager:
         # Connection should be removed after failure
         assert client_id not in connection_manager.active_connections
 
-    def test_is_connected(self, connection_manager: ConnectionManager) -> None:
+    def test_is_connected(
+        self,
+        connection_manager: ConnectionManager,
+        ws_factory: Callable[..., MagicMock],
+    ) -> None:
         """Test checking if a client is connected."""
         client_id: str = "test-client-id"
 
@@ -88,7 +106,7 @@ class TestConnectionManager:
         assert not connection_manager.is_connected(client_id)
 
         # Add connection
-        connection_manager.active_connections[client_id] = MagicMock()
+        connection_manager.active_connections[client_id] = ws_factory()
 
         # Now connected
         assert connection_manager.is_connected(client_id)
@@ -13,7 +13,10 @@ from api.dependencies import (
     validate_message,
 )
 from api.services.connection_manager import ConnectionManager
-from backend.chatbot import ChatBot
+
+# Messages at and just over the 10000 character limit
+_LONG = "a" * 10000
+_TOO_LONG = _LONG + "a"
 
 
 class TestGetChatbot:
@@ -29,11 +32,10 @@ class TestGetChatbot:
 
         assert "ChatBot not initialized" in str(exc_info.value)
 
-    def test_get_chatbot_returns_singleton(self):
+    def test_get_chatbot_returns_singleton(self, spec_chatbot: MagicMock) -> None:
         """Test that get_chatbot returns the same instance when initialized."""
         # Set up a mock chatbot
-        mock_chatbot = MagicMock(spec=ChatBot)
-        set_chatbot(mock_chatbot)
+        set_chatbot(spec_chatbot)
 
         chatbot1 = get_chatbot()
         chatbot2 = get_chatbot()
@@ -82,48 +84,37 @@ class TestGetChatbotStatus:
 class TestValidateMessage:
     """Test suite for validate_message function."""
 
-    def test_validate_message_valid_message(self):
-        """Test validating a valid message."""
-        assert validate_message("Hello, world!") is True
-
-    def test_validate_message_empty_string(self):
-        """Test validating an empty string."""
-        assert validate_message("") is False
-
-    def test_validate_message_whitespace_only(self):
-        """Test validating whitespace-only string."""
-        assert validate_message("   ") is False
-
-    def test_validate_message_none(self):
-        """Test validating None."""
-        # Type ignore because we're testing the function's behavior with None
-        assert validate_message(None) is False  # type: ignore
-
-    def test_validate_message_too_long(self):
-        """Test validating a message that's too long."""
-        long_message = "a" * 10001  # Over 10000 character limit
-        assert validate_message(long_message) is False
-
-    def test_validate_message_at_limit(self):
-        """Test validating a message at the character limit."""
-        limit_message = "a" * 10000  # Exactly 10000 characters
-        assert validate_message(limit_message) is True
+    @pytest.mark.parametrize(
+        ("message", "expected"),
+        [
+            pytest.param("Hello, world!", True, id="valid"),
+            pytest.param("", False, id="empty"),
+            pytest.param("   ", False, id="whitespace-only"),
+            pytest.param(None, False, id="none"),
+            pytest.param(_TOO_LONG, False, id="over-limit"),
+            pytest.param(_LONG, True, id="at-limit"),
+        ],
+    )
+    def test_validate_message(self, message: str | None, expected: bool) -> None:
+        """Test validate_message across valid, empty, and length-limit inputs."""
+        # Type ignore because None is passed to check the function's behavior
+        assert validate_message(message) is expected  # type: ignore[arg-type]
 
 
 class TestInternalChatbotFunctions:
     """Test suite for internal chatbot functions."""
 
-    def test_set_chatbot_and_get_chatbot_internal(self):
+    def test_set_chatbot_and_get_chatbot_internal(
+        self, spec_chatbot: MagicMock
+    ) -> None:
         """Test setting and getting chatbot internally."""
-        mock_chatbot = MagicMock(spec=ChatBot)
-
         # Set the chatbot
-        set_chatbot(mock_chatbot)
+        set_chatbot(spec_chatbot)
 
         # Get the chatbot
         retrieved_chatbot = get_chatbot_internal()
 
-        assert retrieved_chatbot is mock_chatbot
+        assert retrieved_chatbot is spec_chatbot
 
     def test_get_chatbot_internal_returns_none_initially(self):
         """Test that get_chatbot_internal returns None initially."""
@@ -31,6 +31,7 @@ class TestLogging:
         # Just test that the function exists and is callable
         assert callable(configure_structured_logging)
 
+    @patch("api.config.logging._configured_with", None)
     @patch("api.config.logging.structlog")
     def test_configure_structured_logging_configures_structlog(
         self, mock_structlog: MagicMock
@@ -41,6 +42,17 @@ class TestLogging:
         # Should call structlog.configure
         mock_structlog.configure.assert_called_once()
 
+    @patch("api.config.logging._configured_with", None)
+    @patch("api.config.logging.structlog")
+    def test_configure_structured_logging_skips_repeat_configuration(
+        self, mock_structlog: MagicMock
+    ) -> None:
+        """Test that repeating the same configuration is a no-op."""
+        configure_structured_logging(level="INFO", format_json=True)
+        configure_structured_logging(level="INFO", format_json=True)
+
+        mock_structlog.configure.assert_called_once()
+
     def test_get_logger_auto_detection(self):
         """Test logger auto-detection functionality."""
         # Test without providing a name
@@ -65,4 +77,4 @@ class TestLogging:
 
         # Should return consistent loggers
         assert logger1 is not None
-        assert logger2 is not None
+        assert logger1 is logger2
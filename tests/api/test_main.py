@@ -20,10 +20,8 @@ class TestMainApp:
         # We're just checking that the app has routes
         assert len(app.routes) > 0
 
-    def test_health_endpoints_included(self):
+    def test_health_endpoints_included(self, client: TestClient) -> None:
         """Test that health endpoints are included."""
-        client = TestClient(app)
-
         # Test root endpoint
         response = client.get("/")
         assert response.status_code == 200
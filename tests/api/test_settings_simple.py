@@ -7,29 +7,25 @@ from api.config.settings import Settings, get_settings
 class TestSettings:
     """Test suite for Settings class."""
 
-    def test_settings_initialization(self):
+    def test_settings_initialization(self, settings: Settings) -> None:
         """Test Settings initialization."""
-        settings = Settings()
         assert settings is not None
         assert hasattr(settings, "host")
         assert hasattr(settings, "port")
         assert hasattr(settings, "debug")
 
-    def test_settings_has_host(self):
+    def test_settings_has_host(self, settings: Settings) -> None:
         """Test that settings has host attribute."""
-        settings = Settings()
         assert settings.host is not None
         assert isinstance(settings.host, str)
 
-    def test_settings_has_port(self):
+    def test_settings_has_port(self, settings: Settings) -> None:
         """Test that settings has port attribute."""
-        settings = Settings()
         assert settings.port is not None
         assert isinstance(settings.port, int)
 
-    def test_settings_has_debug(self):
+    def test_settings_has_debug(self, settings: Settings) -> None:
         """Test that settings has debug attribute."""
-        settings = Settings()
         assert hasattr(settings, "debug")
         assert isinstance(settings.debug, bool)
 
@@ -44,21 +40,18 @@ class TestSettings:
         settings = get_settings()
         assert isinstance(settings, Settings)
 
-    def test_settings_has_allowed_origins(self):
+    def test_settings_has_allowed_origins(self, settings: Settings) -> None:
         """Test that settings has allowed_origins."""
-        settings = Settings()
         assert hasattr(settings, "allowed_origins")
         assert isinstance(settings.allowed_origins, list)
 
-    def test_settings_has_websocket_config(self):
+    def test_settings_has_websocket_config(self, settings: Settings) -> None:
         """Test that settings has websocket configuration."""
-        settings = Settings()
         assert hasattr(settings, "websocket_ping_interval")
         assert hasattr(settings, "websocket_ping_timeout")
         assert hasattr(settings, "max_connections")
 
-    def test_settings_has_logging_config(self):
+    def test_settings_has_logging_config(self, settings: Settings) -> None:
         """Test that settings has logging configuration."""
-        settings = Settings()
         assert hasattr(settings, "log_level")
         assert hasattr(settings, "log_format_json")
@@ -1,14 +1,25 @@
 """Tests for structured logging configuration."""
 
+import pytest
+
 from api.config.logging import configure_structured_logging, get_logger
 
+# Reconfiguring structlog must not be slowed or failed by third-party
+# deprecation notices raised while processors are rebuilt
+pytestmark = pytest.mark.filterwarnings("ignore::DeprecationWarning")
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _configure_logging_once() -> None:
+    """Configure JSON logging once for the tests in this module."""
+    configure_structured_logging(level="INFO", format_json=True)
+
 
 class TestStructuredLogging:
     """Test suite for structured logging configuration."""
 
     def test_get_logger_returns_valid_logger(self):
         """Test that get_logger returns a valid logger instance."""
-        configure_structured_logging(level="INFO", format_json=True)
         logger = get_logger("test_logger")
 
         # Should be able to call logging methods
@@ -41,7 +52,6 @@ class TestStructuredLogging:
 
     def test_logger_with_custom_fields(self):
         """Test logging with custom structured data."""
-        configure_structured_logging(level="INFO", format_json=True)
         logger = get_logger("custom_test")
 
         # Log with custom structured data
@@ -55,10 +65,13 @@ class TestStructuredLogging:
 
     def test_get_logger_auto_detection(self):
         """Test that get_logger can auto-detect module name."""
-        configure_structured_logging(level="INFO", format_json=True)
-
         # Call without explicit name - should auto-detect
         logger = get_logger()
 
         # Should work without errors
         logger.info("Auto-detection test", auto_detect=True)
+
+    def test_get_logger_is_cached_by_name(self):
+        """Test that repeated lookups of one name return the same logger."""
+        assert get_logger("cached_test") is get_logger("cached_test")
+        assert get_logger("cached_test") is not get_logger("other_cached_test")
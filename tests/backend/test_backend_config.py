@@ -1,80 +1,120 @@
 """Tests for backend configuration."""
 
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING
 
-from backend.config import ServerConfig
+import pytest
+import yaml
 
+if TYPE_CHECKING:
+    from backend.config import ServerConfig
 
-class TestServerConfig:
-    """Test suite for ServerConfig class."""
+SERVER_DIR = Path(__file__).parents[2] / "server"
 
-    def test_server_config_initialization(self):
-        """Test ServerConfig initialization."""
-        config = ServerConfig()
-        assert config is not None
-        assert hasattr(config, "openai_config")
-        assert hasattr(config, "chatbot_config")
-        assert hasattr(config, "logging_config")
 
-    def test_server_config_openai_config_is_dict(self):
-        """Test that openai_config is a dictionary."""
-        config = ServerConfig()
-        assert isinstance(config.openai_config, dict)
+@pytest.fixture(scope="module")
+def server_config() -> "ServerConfig":
+    """Create a ServerConfig instance shared by the tests in this module."""
+    from backend.config import ServerConfig
 
-    def test_server_config_chatbot_config_is_dict(self):
-        """Test that chatbot_config is a dictionary."""
-        config = ServerConfig()
-        assert isinstance(config.chatbot_config, dict)
+    return ServerConfig()
 
-    def test_server_config_logging_config_is_dict(self):
-        """Test that logging_config is a dictionary."""
-        config = ServerConfig()
-        assert isinstance(config.logging_config, dict)
 
-    def test_server_config_configs_are_empty_initially(self):
-        """Test that configs start empty and are populated by server."""
-        config = ServerConfig()
-        # Configs start empty and are populated by the MCP server
-        assert isinstance(config.openai_config, dict)
-        assert isinstance(config.chatbot_config, dict)
-        assert isinstance(config.logging_config, dict)
+class TestServerConfig:
+    """Test suite for ServerConfig class."""
 
-    def test_server_config_validate_temperature_range(self):
+    @pytest.mark.parametrize(
+        "attr", ["openai_config", "chatbot_config", "logging_config"]
+    )
+    def test_config_section_is_dict(
+        self, server_config: "ServerConfig", attr: str
+    ) -> None:
+        """Test that each config section exists and is a dictionary.
+
+        Sections start from defaults and are overlaid by the MCP server.
+        """
+        assert isinstance(getattr(server_config, attr), dict)
+
+    def test_server_config_validate_temperature_range(
+        self, server_config: "ServerConfig"
+    ) -> None:
         """Test temperature validation."""
-        config = ServerConfig()
-        # Default temperature should be valid
-        temp = config.openai_config.get("temperature", 0.7)
+        temp = server_config.openai_config["temperature"]
         assert 0.0 <= temp <= 2.0
 
-    def test_server_config_validate_max_tokens_positive(self):
+    def test_server_config_validate_max_tokens_positive(
+        self, server_config: "ServerConfig"
+    ) -> None:
         """Test max_tokens validation."""
-        config = ServerConfig()
-        # Default max_tokens should be positive
-        max_tokens = config.openai_config.get("max_tokens", 1000)
+        max_tokens = server_config.openai_config["max_tokens"]
         assert max_tokens > 0
 
-    def test_server_config_system_prompt_is_string(self):
+    def test_server_config_system_prompt_is_string(
+        self, server_config: "ServerConfig"
+    ) -> None:
         """Test that system_prompt is a string."""
-        config = ServerConfig()
-        system_prompt = config.chatbot_config.get("system_prompt", "")
+        system_prompt = server_config.chatbot_config["system_prompt"]
         assert isinstance(system_prompt, str)
 
-    def test_server_config_log_level_is_valid(self):
+    def test_server_config_log_level_is_valid(
+        self, server_config: "ServerConfig"
+    ) -> None:
         """Test that log level is valid."""
-        config = ServerConfig()
-        log_level = config.logging_config.get("level", "INFO")
+        log_level = server_config.logging_config["level"]
         valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
         assert log_level in valid_levels
 
-    def test_server_config_configs_exist(self):
-        """Test that config sections exist."""
+    def test_server_values_override_defaults(
+        self, server_config: "ServerConfig"
+    ) -> None:
+        """Test that server sections are merged over the defaults."""
+        merged = server_config._with_defaults(
+            {"openai": {"temperature": 1.2}, "server": {"name": "test"}}
+        )
+
+        assert merged["openai"]["temperature"] == 1.2
+        assert merged["openai"]["max_tokens"] == 2000
+        assert merged["server"] == {"name": "test"}
+        assert server_config.DEFAULT_CONFIG["openai"]["temperature"] == 0.8
+
+    def test_defaults_match_server_defaults(
+        self, server_config: "ServerConfig"
+    ) -> None:
+        """Test that the backend defaults agree with the bundled server's."""
+        server_defaults = yaml.safe_load(
+            (SERVER_DIR / "default_backend_config.yaml").read_text()
+        )
+
+        for section, defaults in server_config.DEFAULT_CONFIG.items():
+            for key, value in defaults.items():
+                if key != "system_prompt":
+                    assert server_defaults[section][key] == value, f"{section}.{key}"
+
+    def test_apply_server_config_fills_missing_keys(self) -> None:
+        """Test that applying a partial config keeps every default key."""
+        from backend.config import ServerConfig
+
         config = ServerConfig()
+        config.apply_server_config({"chatbot": {"system_prompt": "Be brief"}})
 
-        # Test that we can access all config sections
-        assert config.openai_config is not None
-        assert config.chatbot_config is not None
-        assert config.logging_config is not None
+        assert config.chatbot_config["system_prompt"] == "Be brief"
+        assert config.chatbot_config["clear_history_on_exit"] is True
+        assert config.logging_config["enabled"] is True
 
-        # Test that configs are dictionaries
-        assert isinstance(config.openai_config, dict)
-        assert isinstance(config.chatbot_config, dict)
-        assert isinstance(config.logging_config, dict)
+    def test_apply_server_config_keeps_root_level_without_logging(self) -> None:
+        """Test that only a config with a logging section changes the root level."""
+        from backend.config import ServerConfig
+
+        root = logging.getLogger()
+        original_level = root.level
+        config = ServerConfig()
+        try:
+            root.setLevel(logging.DEBUG)
+            config.apply_server_config({"chatbot": {"system_prompt": "Be brief"}})
+            assert root.level == logging.DEBUG
+
+            config.apply_server_config({"logging": {"level": "WARNING"}})
+            assert root.level == logging.WARNING
+        finally:
+            root.setLevel(original_level)
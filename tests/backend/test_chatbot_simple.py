@@ -1,61 +1,130 @@
 """Simple tests for chatbot module."""
 
-from unittest.mock import AsyncMock
+import json
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from backend.chatbot import ChatBot
+if TYPE_CHECKING:
+    from backend.chatbot import ChatBot
+
+
+@pytest.fixture(scope="module")
+def chatbot() -> "ChatBot":
+    """Create a ChatBot shared by the read-only tests in this module."""
+    from backend.chatbot import ChatBot
+
+    return ChatBot()
 
 
 class TestChatBot:
     """Test suite for ChatBot class."""
 
-    def test_chatbot_initialization(self):
+    def test_chatbot_initialization(self, chatbot: "ChatBot") -> None:
         """Test ChatBot initialization."""
-        chatbot = ChatBot()
         assert chatbot is not None
         assert hasattr(chatbot, "config")
         assert hasattr(chatbot, "conversation_manager")
         assert hasattr(chatbot, "mcp_session")
 
-    def test_chatbot_get_current_server_info(self):
+    def test_chatbot_get_current_server_info(self, chatbot: "ChatBot") -> None:
         """Test getting current server info."""
-        chatbot = ChatBot()
         server_info = chatbot.get_current_server_info()
         assert server_info is not None
         assert isinstance(server_info, dict)
 
-    def test_chatbot_has_mcp_session(self):
+    def test_chatbot_has_mcp_session(self, chatbot: "ChatBot") -> None:
         """Test that chatbot has MCP session."""
-        chatbot = ChatBot()
         # Should have an MCP session
         assert chatbot.mcp_session is not None
         assert chatbot.mcp_session.session is None  # Not connected initially
 
-    @pytest.mark.asyncio
+    def test_chatbot_creates_session_lazily(self) -> None:
+        """Test that the MCP session is built on first access and then reused."""
+        from backend.chatbot import ChatBot
+
+        chatbot = ChatBot()
+        assert "mcp_session" not in vars(chatbot)
+
+        session = chatbot.mcp_session
+        assert chatbot.mcp_session is session
+        assert chatbot.conversation_manager.mcp_session is session
+
     async def test_chatbot_cleanup(self):
         """Test chatbot cleanup."""
+        from backend.chatbot import ChatBot
+        from backend.session import MCPSession
+
         chatbot = ChatBot()
 
-        # Mock the MCP session cleanup
-        chatbot.mcp_session.cleanup = AsyncMock()
+        # Mock the MCP session cleanup; MCPSession uses __slots__, so patch the class
+        with patch.object(MCPSession, "cleanup", new_callable=AsyncMock) as mock_cleanup:
+            await chatbot.cleanup()
+
+        # Should call cleanup on MCP session
+        mock_cleanup.assert_called_once()
+
+    async def test_cleanup_without_api_key(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that cleanup still closes the session when no API key is set."""
+        from backend.chatbot import ChatBot
+
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        chatbot = ChatBot()
+        chatbot.mcp_session = AsyncMock()
 
         await chatbot.cleanup()
 
-        # Should call cleanup on MCP session
-        chatbot.mcp_session.cleanup.assert_called_once()
+        assert "conversation_manager" not in vars(chatbot)
+        chatbot.mcp_session.cleanup.assert_awaited_once()
+
+    async def test_connect_without_api_key_spawns_nothing(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a missing API key fails before the server is started."""
+        from backend.chatbot import ChatBot
+        from backend.exceptions import ConfigurationError
+
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        chatbot = ChatBot()
+        chatbot.mcp_session = AsyncMock()
+
+        with pytest.raises(ConfigurationError):
+            await chatbot.connect_to_server(["python", "server.py"])
+
+        chatbot.mcp_session.connect.assert_not_awaited()
+
+    async def test_cleanup_after_partial_config_reload(self) -> None:
+        """Test that a reload missing keys still leaves cleanup working."""
+        from backend.chatbot import ChatBot
 
-    def test_chatbot_conversation_manager_exists(self):
-        """Test that conversation manager exists."""
         chatbot = ChatBot()
+        chatbot.mcp_session = AsyncMock(session=object())
+        partial = {"chatbot": {"system_prompt": "Be brief"}}
+
+        with (
+            patch.object(chatbot.config, "has_server_capability", return_value=True),
+            patch(
+                "backend.chatbot.extract_tool_content",
+                side_effect=["2", json.dumps(partial)],
+            ),
+        ):
+            await chatbot._update_config_if_changed()  # type: ignore[protected]
+
+        assert chatbot.config.chatbot_config["clear_history_on_exit"] is True
+        await chatbot.cleanup()
+        chatbot.mcp_session.cleanup.assert_awaited_once()
+
+    def test_chatbot_conversation_manager_exists(self, chatbot: "ChatBot") -> None:
+        """Test that conversation manager exists."""
         assert chatbot.conversation_manager is not None
 
-    def test_chatbot_config_exists(self):
+    def test_chatbot_config_exists(self, chatbot: "ChatBot") -> None:
         """Test that config exists."""
-        chatbot = ChatBot()
         assert chatbot.config is not None
 
-    def test_chatbot_mcp_session_exists(self):
+    def test_chatbot_mcp_session_exists(self, chatbot: "ChatBot") -> None:
         """Test that MCP session exists."""
-        chatbot = ChatBot()
         assert chatbot.mcp_session is not None
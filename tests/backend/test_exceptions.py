@@ -1,7 +1,13 @@
 """Tests for backend exceptions."""
 
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
 from backend.exceptions import (
     ChatBotBaseError,
+    ChatBotConnectionError,
     ConfigurationError,
     MessageProcessingError,
     ServerConnectionError,
@@ -10,6 +16,29 @@ from backend.exceptions import (
 )
 
 
+@pytest.fixture(scope="module")
+def make_exc() -> Callable[..., ChatBotBaseError]:
+    """Return a factory for fully populated base exceptions."""
+
+    def _make(**overrides: Any) -> ChatBotBaseError:
+        kwargs: dict[str, Any] = {
+            "message": "Test message",
+            "error_code": "TEST_ERROR",
+            "context": {"key": "value"},
+            "cause": ValueError("Original error"),
+        }
+        kwargs.update(overrides)
+        return ChatBotBaseError(**kwargs)
+
+    return _make
+
+
+@pytest.fixture(scope="module")
+def base_exc(make_exc: Callable[..., ChatBotBaseError]) -> ChatBotBaseError:
+    """Provide a fully populated base exception shared across the module."""
+    return make_exc()
+
+
 class TestChatBotBaseError:
     """Test suite for ChatBotBaseError."""
 
@@ -22,50 +51,33 @@ class TestChatBotBaseError:
         assert exc.context == {}
         assert exc.cause is None
 
-    def test_exception_with_all_params(self) -> None:
+    def test_exception_with_all_params(
+        self, make_exc: Callable[..., ChatBotBaseError]
+    ) -> None:
         """Test creating exception with all parameters."""
         context = {"key": "value"}
         cause = ValueError("Original error")
 
-        exc = ChatBotBaseError(
-            message="Test message",
-            error_code="TEST_ERROR",
-            context=context,
-            cause=cause,
-        )
+        exc = make_exc(context=context, cause=cause)
 
         assert exc.message == "Test message"
         assert exc.error_code == "TEST_ERROR"
         assert exc.context == context
         assert exc.cause == cause
 
-    def test_to_dict_method(self) -> None:
+    def test_to_dict_method(self, base_exc: ChatBotBaseError) -> None:
         """Test the to_dict method."""
-        context = {"key": "value"}
-        cause = ValueError("Original error")
-
-        exc = ChatBotBaseError(
-            message="Test message",
-            error_code="TEST_ERROR",
-            context=context,
-            cause=cause,
-        )
-
-        result = exc.to_dict()
+        result = base_exc.to_dict()
 
         assert result["error_type"] == "ChatBotBaseError"
         assert result["message"] == "Test message"
         assert result["error_code"] == "TEST_ERROR"
-        assert result["context"] == context
+        assert result["context"] == {"key": "value"}
         assert result["cause"] == "Original error"
 
-    def test_str_representation(self) -> None:
+    def test_str_representation(self, base_exc: ChatBotBaseError) -> None:
         """Test string representation with error code and context."""
-        exc = ChatBotBaseError(
-            message="Test message", error_code="TEST_ERROR", context={"key": "value"}
-        )
-
-        str_repr = str(exc)
+        str_repr = str(base_exc)
         assert "Test message" in str_repr
         assert "[TEST_ERROR]" in str_repr
         assert "Context:" in str_repr
@@ -74,24 +86,22 @@ class TestChatBotBaseError:
 class TestDomainSpecificExceptions:
     """Test suite for domain-specific exceptions."""
 
-    def test_configuration_error_inheritance(self) -> None:
-        """Test that ConfigurationError inherits from base exception."""
-        exc = ConfigurationError("Config error")
-        assert isinstance(exc, ChatBotBaseError)
-        assert exc.message == "Config error"
-
-    def test_server_connection_error(self) -> None:
-        """Test ServerConnectionError creation."""
-        exc = ServerConnectionError(
-            "Connection failed", error_code="CONNECTION_TIMEOUT"
-        )
-        assert isinstance(exc, ChatBotBaseError)
-        assert exc.error_code == "CONNECTION_TIMEOUT"
-
-    def test_message_processing_error(self) -> None:
-        """Test MessageProcessingError creation."""
-        exc = MessageProcessingError("Processing failed")
+    @pytest.mark.parametrize(
+        ("exc_class", "kwargs"),
+        [
+            (ConfigurationError, {}),
+            (ServerConnectionError, {"error_code": "CONNECTION_TIMEOUT"}),
+            (MessageProcessingError, {}),
+        ],
+    )
+    def test_subclass_creation(
+        self, exc_class: type[ChatBotBaseError], kwargs: dict[str, str]
+    ) -> None:
+        """Test that domain exceptions inherit from the base exception."""
+        exc = exc_class("Domain error", **kwargs)
         assert isinstance(exc, ChatBotBaseError)
+        assert exc.message == "Domain error"
+        assert exc.error_code == kwargs.get("error_code")
 
 
 class TestWrapException:
@@ -125,17 +135,14 @@ class TestWrapException:
 class TestGetExceptionForDomain:
     """Test suite for get_exception_for_domain utility."""
 
-    def test_get_configuration_domain_exception(self) -> None:
-        """Test getting exception class for configuration domain."""
-        exc_class = get_exception_for_domain("configuration")
-        assert exc_class == ConfigurationError
-
-    def test_get_connection_domain_exception(self) -> None:
-        """Test getting exception class for connection domain."""
-        get_exception_for_domain("connection")
-        # Should return a connection-related exception class
-
-    def test_get_unknown_domain_exception(self) -> None:
-        """Test getting exception class for unknown domain."""
-        exc_class = get_exception_for_domain("unknown")
-        assert exc_class == ChatBotBaseError
+    @pytest.mark.parametrize(
+        ("domain", "expected"),
+        [
+            ("configuration", ConfigurationError),
+            ("connection", ChatBotConnectionError),
+            ("unknown", ChatBotBaseError),
+        ],
+    )
+    def test_domain_lookup(self, domain: str, expected: type) -> None:
+        """Test getting the exception class for a domain."""
+        assert get_exception_for_domain(domain) is expected
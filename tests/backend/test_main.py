@@ -1,111 +1,124 @@
 """Tests for backend main module."""
 
-import argparse
 import contextlib
+import logging
 import subprocess
+import sys
+from collections.abc import Callable
+from pathlib import Path
+from types import ModuleType
 from unittest.mock import MagicMock, patch
 
-from backend.__main__ import launch_backend_server, main, parse_args
+import pytest
+
+
+@pytest.fixture
+def backend_main() -> ModuleType:
+    """Import backend.__main__ on first use rather than at collection time."""
+    import backend.__main__
+
+    return backend.__main__
+
+
+@pytest.fixture
+def set_argv(monkeypatch: pytest.MonkeyPatch) -> Callable[[list[str]], None]:
+    """Return a setter that swaps ``sys.argv`` for the duration of the test."""
+
+    def _set(argv: list[str]) -> None:
+        monkeypatch.setattr(sys, "argv", argv)
+
+    return _set
 
 
 class TestBackendMain:
     """Test suite for backend main module."""
 
-    def test_parse_args_default(self):
-        """Test parse_args with default arguments."""
-        with patch("sys.argv", ["backend"]):
-            args = parse_args()
-            assert args.server_path is None
-            assert args.show_config is False
-            assert args.verbose is False
-
-    def test_parse_args_server_path(self):
-        """Test parse_args with server path."""
-        with patch("sys.argv", ["backend", "--server-path", "/path/to/server.py"]):
-            args = parse_args()
-            assert args.server_path == "/path/to/server.py"
-
-    def test_parse_args_show_config(self):
-        """Test parse_args with show-config flag."""
-        with patch("sys.argv", ["backend", "--show-config"]):
-            args = parse_args()
-            assert args.show_config is True
-
-    def test_parse_args_verbose(self):
-        """Test parse_args with verbose flag."""
-        with patch("sys.argv", ["backend", "--verbose"]):
-            args = parse_args()
-            assert args.verbose is True
-
-    def test_parse_args_verbose_short(self):
-        """Test parse_args with short verbose flag."""
-        with patch("sys.argv", ["backend", "-v"]):
-            args = parse_args()
-            assert args.verbose is True
-
-    def test_parse_args_all_options(self):
-        """Test parse_args with all options."""
-        with patch(
-            "sys.argv",
-            [
-                "backend",
-                "--server-path",
-                "/path/to/server.py",
-                "--show-config",
-                "--verbose",
-            ],
-        ):
-            args = parse_args()
-            assert args.server_path == "/path/to/server.py"
-            assert args.show_config is True
-            assert args.verbose is True
+    @pytest.mark.parametrize(
+        ("argv", "expected"),
+        [
+            ([], {"server_path": None, "show_config": False, "verbose": False}),
+            (
+                ["--server-path", "/path/to/server.py"],
+                {"server_path": "/path/to/server.py"},
+            ),
+            (["--show-config"], {"show_config": True}),
+            (["--verbose"], {"verbose": True}),
+            (["-v"], {"verbose": True}),
+            (
+                ["--server-path", "/path/to/server.py", "--show-config", "--verbose"],
+                {
+                    "server_path": "/path/to/server.py",
+                    "show_config": True,
+                    "verbose": True,
+                },
+            ),
+        ],
+        ids=["default", "server_path", "show_config", "verbose", "verbose_short", "all"],
+    )
+    def test_parse_args(
+        self, backend_main: ModuleType, argv: list[str], expected: dict[str, object]
+    ) -> None:
+        """Test parse_args flag handling."""
+        args = backend_main.parse_args(argv)
+        for attr, value in expected.items():
+            assert getattr(args, attr) == value
+
+    def test_parse_args_reads_sys_argv(
+        self, backend_main: ModuleType, set_argv: Callable[[list[str]], None]
+    ) -> None:
+        """Test parse_args falls back to sys.argv when no argv is given."""
+        set_argv(["backend", "--verbose"])
+        assert backend_main.parse_args().verbose is True
 
-    def test_parse_args_help(self):
+    def test_parse_args_help(self, backend_main: ModuleType) -> None:
         """Test parse_args help output."""
-        with patch("sys.argv", ["backend", "--help"]):
-            with patch("argparse.ArgumentParser.print_help") as mock_help:
-                with contextlib.suppress(SystemExit):
-                    parse_args()
-                mock_help.assert_called_once()
-
-    @patch("backend.__main__.ChatBot")
-    @patch("backend.__main__.launch_backend_server")
+        with (
+            patch("argparse.ArgumentParser.print_help") as mock_help,
+            contextlib.suppress(SystemExit),
+        ):
+            backend_main.parse_args(["--help"])
+        mock_help.assert_called_once()
+
     def test_main_default_behavior(
-        self, mock_launch: MagicMock, mock_chatbot_class: MagicMock
+        self, backend_main: ModuleType, set_argv: Callable[[list[str]], None]
     ) -> None:
         """Test main function with default behavior."""
-        mock_chatbot = MagicMock()
-        mock_chatbot_class.return_value = mock_chatbot
+        mock_chatbot_class = MagicMock()
+        mock_launch = MagicMock()
 
-        with patch("sys.argv", ["backend"]):
-            main()
+        set_argv(["backend"])
+        with patch.multiple(
+            backend_main, ChatBot=mock_chatbot_class, launch_backend_server=mock_launch
+        ):
+            backend_main.main()
 
-            # Should create chatbot
-            mock_chatbot_class.assert_called_once()
-            # Should launch backend server
-            mock_launch.assert_called_once()
+        # Should create chatbot
+        mock_chatbot_class.assert_called_once()
+        # Should launch backend server
+        mock_launch.assert_called_once()
 
-    @patch("backend.__main__.ChatBot")
-    @patch("backend.__main__.launch_backend_server")
     def test_main_with_server_path(
-        self, mock_launch: MagicMock, mock_chatbot_class: MagicMock
+        self, backend_main: ModuleType, set_argv: Callable[[list[str]], None]
     ) -> None:
         """Test main function with server path."""
-        mock_chatbot = MagicMock()
-        mock_chatbot_class.return_value = mock_chatbot
+        mock_chatbot_class = MagicMock()
+        mock_launch = MagicMock()
 
-        with patch("sys.argv", ["backend", "--server-path", "/path/to/server.py"]):
-            main()
+        set_argv(["backend", "--server-path", "/path/to/server.py"])
+        with patch.multiple(
+            backend_main, ChatBot=mock_chatbot_class, launch_backend_server=mock_launch
+        ):
+            backend_main.main()
 
-            # Should set server path
-            mock_chatbot.set_server_path.assert_called_once_with("/path/to/server.py")
-            # Should launch backend server
-            mock_launch.assert_called_once()
+        # Should set server path
+        mock_chatbot_class.return_value.set_server_path.assert_called_once_with(
+            "/path/to/server.py"
+        )
+        # Should launch backend server
+        mock_launch.assert_called_once()
 
-    @patch("backend.__main__.ChatBot")
-    @patch("builtins.print")
     def test_main_show_config(
-        self, mock_print: MagicMock, mock_chatbot_class: MagicMock
+        self, backend_main: ModuleType, set_argv: Callable[[list[str]], None]
     ) -> None:
         """Test main function with show-config flag."""
         mock_chatbot = MagicMock()
@@ -117,175 +130,148 @@ class TestBackendMain:
             "max_connections": 100,
         }
         mock_chatbot.connection_config.is_stt_enabled.return_value = True
-        mock_chatbot_class.return_value = mock_chatbot
 
-        with patch("sys.argv", ["backend", "--show-config"]):
-            main()
+        set_argv(["backend", "--show-config"])
+        with (
+            patch.object(backend_main, "ChatBot", return_value=mock_chatbot),
+            patch("builtins.print") as mock_print,
+        ):
+            backend_main.main()
 
-            # Should show config
-            mock_print.assert_called()
-            mock_chatbot.get_configured_server_path.assert_called_once()
-            mock_chatbot.connection_config.get_backend_config.assert_called_once()
-            mock_chatbot.connection_config.is_stt_enabled.assert_called_once()
+        # Should show config
+        mock_print.assert_called()
+        mock_chatbot.get_configured_server_path.assert_called_once()
+        mock_chatbot.connection_config.get_backend_config.assert_called_once()
+        mock_chatbot.connection_config.is_stt_enabled.assert_called_once()
 
-    @patch("backend.__main__.ChatBot")
-    @patch("builtins.print")
     def test_main_show_config_error(
-        self, mock_print: MagicMock, mock_chatbot_class: MagicMock
+        self, backend_main: ModuleType, set_argv: Callable[[list[str]], None]
     ) -> None:
         """Test main function with show-config flag and error."""
         mock_chatbot = MagicMock()
-        mock_chatbot.get_configured_server_path.side_effect = RuntimeError(
-            "Config error"
-        )
-        mock_chatbot_class.return_value = mock_chatbot
+        mock_chatbot.get_configured_server_path.side_effect = RuntimeError("Config error")
 
-        with patch("sys.argv", ["backend", "--show-config"]):
-            main()
-
-            # Should handle error gracefully
-            mock_print.assert_called_with("Error retrieving configuration")
-
-    @patch("backend.__main__.ChatBot")
-    def test_main_keyboard_interrupt(self, mock_chatbot_class: MagicMock) -> None:
-        """Test main function with keyboard interrupt."""
-        mock_chatbot = MagicMock()
-        mock_chatbot_class.side_effect = KeyboardInterrupt()
-        mock_chatbot_class.return_value = mock_chatbot
+        set_argv(["backend", "--show-config"])
+        with (
+            patch.object(backend_main, "ChatBot", return_value=mock_chatbot),
+            patch("builtins.print") as mock_print,
+        ):
+            backend_main.main()
 
-        with patch("sys.argv", ["backend"]), patch("builtins.print") as mock_print:
-            main()
-            mock_print.assert_called_with("\n👋 Goodbye!")
+        # Should handle error gracefully
+        mock_print.assert_called_with("Error retrieving configuration")
 
-    @patch("backend.__main__.ChatBot")
-    def test_main_exception(self, mock_chatbot_class: MagicMock) -> None:
-        """Test main function with exception."""
-        MagicMock()
-        mock_chatbot_class.side_effect = RuntimeError("Test error")
-
-        with patch("sys.argv", ["backend"]), patch("sys.exit") as mock_exit:
-            with patch("builtins.print") as mock_print:
-                main()
-                mock_print.assert_called_with("\n❌ Error: Test error")
-                mock_exit.assert_called_once_with(1)
-
-    @patch("subprocess.run")
-    @patch("pathlib.Path")
-    def test_launch_backend_server_success(
-        self, mock_path: MagicMock, mock_run: MagicMock
+    def test_main_keyboard_interrupt(
+        self, backend_main: ModuleType, set_argv: Callable[[list[str]], None]
     ) -> None:
-        """Test launch_backend_server success."""
-        mock_backend_script = MagicMock()
-        mock_backend_script.exists.return_value = True
-        mock_path.return_value.parent.parent.__truediv__.return_value = (
-            mock_backend_script
-        )
-
-        launch_backend_server()
-
-        mock_run.assert_called_once()
-
-    @patch("pathlib.Path")
-    def test_launch_backend_server_script_not_found(self, mock_path: MagicMock) -> None:
-        """Test launch_backend_server with script not found."""
-        mock_backend_script = MagicMock()
-        mock_backend_script.exists.return_value = False
-        mock_path.return_value.parent.parent.__truediv__.return_value = (
-            mock_backend_script
-        )
+        """Test main function with keyboard interrupt."""
+        set_argv(["backend"])
+        with (
+            patch.object(backend_main, "ChatBot", side_effect=KeyboardInterrupt()),
+            patch("builtins.print") as mock_print,
+        ):
+            backend_main.main()
 
-        with patch("sys.exit") as mock_exit:
-            launch_backend_server()
-            mock_exit.assert_called_once_with(1)
+        mock_print.assert_called_with("\n👋 Goodbye!")
 
-    @patch("subprocess.run")
-    @patch("pathlib.Path")
-    def test_launch_backend_server_subprocess_error(
-        self, mock_path: MagicMock, mock_run: MagicMock
+    def test_main_exception(
+        self, backend_main: ModuleType, set_argv: Callable[[list[str]], None]
     ) -> None:
-        """Test launch_backend_server with subprocess error."""
-        mock_backend_script = MagicMock()
-        mock_backend_script.exists.return_value = True
-        mock_path.return_value.parent.parent.__truediv__.return_value = (
-            mock_backend_script
-        )
-
-        mock_run.side_effect = subprocess.CalledProcessError(1, "test")
-
-        with patch("sys.exit") as mock_exit:
-            launch_backend_server()
-            mock_exit.assert_called_once_with(1)
-
-    @patch("subprocess.run")
-    @patch("pathlib.Path")
-    def test_launch_backend_server_keyboard_interrupt(
-        self, mock_path: MagicMock, mock_run: MagicMock
+        """Test main function with exception."""
+        set_argv(["backend"])
+        with (
+            patch.object(backend_main, "ChatBot", side_effect=RuntimeError("Test error")),
+            patch("sys.exit") as mock_exit,
+            patch("builtins.print") as mock_print,
+        ):
+            backend_main.main()
+
+        mock_print.assert_called_with("\n❌ Error: Test error")
+        mock_exit.assert_called_once_with(1)
+
+    @pytest.mark.parametrize(
+        ("exists", "side_effect", "expect_exit", "expect_print"),
+        [
+            (True, None, None, None),
+            (False, None, 1, None),
+            (True, subprocess.CalledProcessError(1, "test"), 1, None),
+            (True, KeyboardInterrupt(), None, "\n🛑 Server stopped by user"),
+            (True, RuntimeError("Test error"), 1, None),
+        ],
+        ids=[
+            "success",
+            "script_not_found",
+            "subprocess_error",
+            "keyboard_interrupt",
+            "general_exception",
+        ],
+    )
+    def test_launch_backend_server(
+        self,
+        backend_main: ModuleType,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        exists: bool,
+        side_effect: BaseException | None,
+        expect_exit: int | None,
+        expect_print: str | None,
     ) -> None:
-        """Test launch_backend_server with keyboard interrupt."""
-        mock_backend_script = MagicMock()
-        mock_backend_script.exists.return_value = True
-        mock_path.return_value.parent.parent.__truediv__.return_value = (
-            mock_backend_script
-        )
-
-        mock_run.side_effect = KeyboardInterrupt()
+        """Test launch_backend_server outcomes for each subprocess result."""
+        script = tmp_path / "run_backend.py"
+        if exists:
+            script.write_text("")
+        # launch_backend_server resolves the script two levels above __file__
+        monkeypatch.setattr(backend_main, "Path", lambda *_: tmp_path / "backend" / "__main__.py")
 
-        with patch("builtins.print") as mock_print:
-            launch_backend_server()
-            mock_print.assert_called_with("\n🛑 Server stopped by user")
-
-    @patch("subprocess.run")
-    @patch("pathlib.Path")
-    def test_launch_backend_server_general_exception(
-        self, mock_path: MagicMock, mock_run: MagicMock
+        with (
+            patch.object(
+                backend_main.subprocess, "run", side_effect=side_effect
+            ) as mock_run,
+            patch("sys.exit") as mock_exit,
+            patch("builtins.print") as mock_print,
+        ):
+            backend_main.launch_backend_server()
+
+        if exists:
+            assert str(script) in mock_run.call_args.args[0]
+        else:
+            mock_run.assert_not_called()
+        if expect_exit is None:
+            mock_exit.assert_not_called()
+        else:
+            mock_exit.assert_called_once_with(expect_exit)
+        if expect_print is None:
+            mock_print.assert_not_called()
+        else:
+            mock_print.assert_called_once_with(expect_print)
+
+    def test_parse_args_help_text(self, backend_main: ModuleType) -> None:
+        """Test that the parser defines the expected options."""
+        parser = backend_main._build_parser()
+
+        assert parser is backend_main._build_parser()
+        option_strings = {option for action in parser._actions for option in action.option_strings}
+        assert {"--server-path", "--show-config", "--verbose", "-v"} <= option_strings
+
+    @pytest.mark.parametrize(
+        ("argv", "level"),
+        [(["backend", "--verbose"], logging.DEBUG), (["backend"], logging.INFO)],
+    )
+    def test_main_logging_level(
+        self,
+        backend_main: ModuleType,
+        set_argv: Callable[[list[str]], None],
+        argv: list[str],
+        level: int,
     ) -> None:
-        """Test launch_backend_server with general exception."""
-        mock_backend_script = MagicMock()
-        mock_backend_script.exists.return_value = True
-        mock_path.return_value.parent.parent.__truediv__.return_value = (
-            mock_backend_script
-        )
-
-        mock_run.side_effect = RuntimeError("Test error")
-
-        with patch("sys.exit") as mock_exit:
-            launch_backend_server()
-            mock_exit.assert_called_once_with(1)
-
-    def test_parse_args_help_text(self):
-        """Test that help text contains expected information."""
-        parser = argparse.ArgumentParser()
-        parser.add_argument("--server-path", help="Path to MCP server to use")
-        parser.add_argument(
-            "--show-config",
-            action="store_true",
-            help="Show current server configuration",
-        )
-        parser.add_argument(
-            "--verbose", "-v", action="store_true", help="Enable verbose logging"
-        )
-
-        # Test that arguments are properly defined
-        assert any("--server-path" in str(action) for action in parser._actions)
-        assert any("--show-config" in str(action) for action in parser._actions)
-        assert any("--verbose" in str(action) for action in parser._actions)
-        assert any("-v" in str(action) for action in parser._actions)
-
-    @patch("backend.__main__.logging.basicConfig")
-    def test_main_verbose_logging(self, mock_logging: MagicMock) -> None:
-        """Test main function with verbose logging."""
+        """Test that main configures logging from the verbose flag."""
+        set_argv(argv)
         with (
-            patch("sys.argv", ["backend", "--verbose"]),
-            patch("backend.__main__.ChatBot"),
+            patch.multiple(
+                backend_main, ChatBot=MagicMock(), launch_backend_server=MagicMock()
+            ),
+            patch.object(backend_main.logging, "basicConfig") as mock_logging,
         ):
-            with patch("backend.__main__.launch_backend_server"):
-                main()
-                mock_logging.assert_called_with(level=10)  # DEBUG level
-
-    @patch("backend.__main__.logging.basicConfig")
-    def test_main_normal_logging(self, mock_logging: MagicMock) -> None:
-        """Test main function with normal logging."""
-        with patch("sys.argv", ["backend"]), patch("backend.__main__.ChatBot"):
-            with patch("backend.__main__.launch_backend_server"):
-                main()
-                mock_logging.assert_called_with(level=20)  # INFO level
+            backend_main.main()
+
+        mock_logging.assert_called_with(level=level)
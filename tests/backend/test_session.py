@@ -1,6 +1,6 @@
 """Tests for MCP session management."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -27,7 +27,6 @@ class TestMCPSession:
         assert info["command"] == "test"
         assert info["args"] == []
 
-    @pytest.mark.asyncio
     async def test_get_tools_for_openai_not_initialized(self):
         """Test getting tools when session is not initialized."""
         session = MCPSession()
@@ -37,7 +36,6 @@ class TestMCPSession:
 
         assert "Session is not initialized" in str(exc_info.value)
 
-    @pytest.mark.asyncio
     async def test_call_tool_not_initialized(self):
         """Test calling tool when session is not initialized."""
         session = MCPSession()
@@ -47,7 +45,6 @@ class TestMCPSession:
 
         assert "Session is not initialized" in str(exc_info.value)
 
-    @pytest.mark.asyncio
     async def test_cleanup(self):
         """Test session cleanup."""
         session = MCPSession()
@@ -61,7 +58,6 @@ class TestMCPSession:
         # Should call aclose on exit_stack
         session.exit_stack.aclose.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_cleanup_with_exception(self):
         """Test session cleanup with exception."""
         session = MCPSession()
@@ -74,68 +70,18 @@ class TestMCPSession:
         # Should not raise exception
         await session.cleanup()
 
-    @pytest.mark.asyncio
-    @patch("backend.session.stdio_client")
-    @patch("backend.session.ClientSession")
-    async def test_connect_with_string_command(
+    @pytest.mark.parametrize("command", ["python test.py", ["python", "test.py"]])
+    async def test_connect(
         self,
-        mock_client_session: MagicMock,
-        mock_stdio_client: MagicMock,
+        mcp_session_with_stubbed_transport: tuple[MCPSession, MagicMock],
+        command: str | list[str],
     ) -> None:
-        """Test connecting with string command."""
-        session = MCPSession()
-
-        # Mock the stdio client and session
-        mock_transport = (MagicMock(), MagicMock())
-        mock_stdio_client.return_value.__aenter__.return_value = mock_transport
-
-        mock_session_instance = AsyncMock()
-        mock_tools_result = MagicMock()
-        mock_tools_result.tools = []
-        mock_session_instance.list_tools.return_value = mock_tools_result
-        mock_client_session.return_value.__aenter__.return_value = mock_session_instance
-
-        # Mock exit_stack
-        session.exit_stack = AsyncMock()
-        session.exit_stack.enter_async_context = AsyncMock(
-            side_effect=[mock_transport, mock_session_instance]
-        )
+        """Test connecting with string and list commands."""
+        session, mock_tools_result = mcp_session_with_stubbed_transport
 
-        result = await session.connect("python test.py")
-
-        assert session.server_info["command"] == "python"
-        assert session.server_info["args"] == ["test.py"]
-        assert result == mock_tools_result
-
-    @pytest.mark.asyncio
-    @patch("backend.session.stdio_client")
-    @patch("backend.session.ClientSession")
-    async def test_connect_with_list_command(
-        self,
-        mock_client_session: MagicMock,
-        mock_stdio_client: MagicMock,
-    ) -> None:
-        """Test connecting with list command."""
-        session = MCPSession()
-
-        # Mock the stdio client and session
-        mock_transport = (MagicMock(), MagicMock())
-        mock_stdio_client.return_value.__aenter__.return_value = mock_transport
-
-        mock_session_instance = AsyncMock()
-        mock_tools_result = MagicMock()
-        mock_tools_result.tools = []
-        mock_session_instance.list_tools.return_value = mock_tools_result
-        mock_client_session.return_value.__aenter__.return_value = mock_session_instance
-
-        # Mock exit_stack
-        session.exit_stack = AsyncMock()
-        session.exit_stack.enter_async_context = AsyncMock(
-            side_effect=[mock_transport, mock_session_instance]
-        )
-
-        result = await session.connect(["python", "test.py"])
+        result = await session.connect(command)
 
         assert session.server_info["command"] == "python"
         assert session.server_info["args"] == ["test.py"]
         assert result == mock_tools_result
+        await session.cleanup()
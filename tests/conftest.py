@@ -1,29 +1,70 @@
 """Pytest configuration and shared fixtures."""
 
 import asyncio
+import contextlib
+from collections.abc import AsyncIterator
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, MagicMock
-from typing import Generator
 
 import pytest
-from fastapi.testclient import TestClient
 
-from api.main import app
+try:
+    import uvloop
+except ImportError:  # Not available on Windows; fall back to the default loop
+    uvloop = None  # type: ignore[assignment]
+
+# App and backend imports are deferred to the fixtures that need them so
+# collecting unrelated tests does not pull in the whole backend
+if TYPE_CHECKING:
+    from fastapi.testclient import TestClient
+
+    from api.config.settings import Settings
+    from backend.session import MCPSession
 
 
 @pytest.fixture(scope="session")
-def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run async tests on uvloop when it is installed."""
+    if uvloop is None:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
 
 
-@pytest.fixture
-def client() -> TestClient:
-    """Create a test client for the FastAPI app."""
+@pytest.fixture(scope="session")
+def client() -> "TestClient":
+    """Create a test client for the FastAPI app, shared across the session."""
+    from fastapi.testclient import TestClient
+
+    from api.main import app
+
     return TestClient(app)
 
 
+@pytest.fixture(scope="session")
+def settings() -> "Settings":
+    """Create a Settings instance once for the test session."""
+    from api.config.settings import Settings
+
+    return Settings()
+
+
+@pytest.fixture(scope="session")
+def spec_chatbot() -> MagicMock:
+    """ChatBot-spec'd mock shared across the session for identity checks."""
+    from backend.chatbot import ChatBot
+
+    return MagicMock(spec=ChatBot)
+
+
+@pytest.fixture(scope="session")
+def server_module() -> ModuleType:
+    """The MCP server module, imported once for the session on first use."""
+    import server.server
+
+    return server.server
+
+
 @pytest.fixture
 def mock_chatbot():
     """Mock ChatBot instance for testing."""
@@ -47,6 +88,31 @@ def mock_connection_manager():
     return mock
 
 
+@pytest.fixture
+def mcp_session_with_stubbed_transport(
+    monkeypatch: pytest.MonkeyPatch,
+) -> tuple["MCPSession", MagicMock]:
+    """MCPSession whose stdio transport and client session are async stubs."""
+    from backend.session import MCPSession
+
+    transport = (MagicMock(), MagicMock())
+    tools_result = MagicMock(tools=[])
+    client_session = AsyncMock()
+    client_session.list_tools.return_value = tools_result
+
+    @contextlib.asynccontextmanager
+    async def stub_stdio_client(*_: Any) -> AsyncIterator[tuple[MagicMock, MagicMock]]:
+        yield transport
+
+    @contextlib.asynccontextmanager
+    async def stub_client_session(*_: Any) -> AsyncIterator[AsyncMock]:
+        yield client_session
+
+    monkeypatch.setattr("backend.session.stdio_client", stub_stdio_client)
+    monkeypatch.setattr("backend.session.ClientSession", stub_client_session)
+    return MCPSession(), tools_result
+
+
 @pytest.fixture
 def sample_websocket_message():
     """Sample WebSocket message for testing."""
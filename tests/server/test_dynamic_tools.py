@@ -1,70 +1,115 @@
 """Tests for dynamic tool management."""
 
-from typing import Any, Dict
-from unittest.mock import AsyncMock, MagicMock, patch
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, cast
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
 from server.dynamic_tools import DynamicToolManager
 
+if TYPE_CHECKING:
+    from fastmcp import FastMCP
+
+_UPDATE_METHODS = (
+    "_update_configuration_tools",
+    "_update_openai_tools",
+    "_update_logging_tools",
+    "_update_chatbot_tools",
+)
+
+
+@dataclass
+class StubMCPServer:
+    """Stand-in for the only FastMCP attribute DynamicToolManager uses."""
+
+    tool: Mock = field(default_factory=Mock)
+
+
+MakeManager = Callable[[dict[str, Any]], DynamicToolManager]
+
+
+@pytest.fixture
+def mcp_server() -> StubMCPServer:
+    """Per-test stub server, exposed so tests can inspect its tool decorator."""
+    return StubMCPServer()
+
+
+@pytest.fixture
+def make_manager(mcp_server: StubMCPServer) -> MakeManager:
+    """Build managers around the test's stub server, typed as the real FastMCP."""
+    server = cast("FastMCP[Any]", mcp_server)
+
+    def _make(config: dict[str, Any]) -> DynamicToolManager:
+        return DynamicToolManager(server, config)
+
+    return _make
+
+
+@pytest.fixture(scope="module")
+def readonly_manager() -> DynamicToolManager:
+    """Manager shared by the tests that only call its lookup helpers."""
+    return DynamicToolManager(cast("FastMCP[Any]", StubMCPServer()), {})
+
+
+@pytest.fixture
+def patched_update_methods(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Callable[[DynamicToolManager], dict[str, AsyncMock]]:
+    """Replace a manager's _update_*_tools methods with AsyncMocks."""
+
+    def _apply(manager: DynamicToolManager) -> dict[str, AsyncMock]:
+        mocks = {name: AsyncMock() for name in _UPDATE_METHODS}
+        for name, mock in mocks.items():
+            monkeypatch.setattr(manager, name, mock)
+        return mocks
+
+    return _apply
+
 
 class TestDynamicToolManager:
     """Test suite for DynamicToolManager class."""
 
-    def test_dynamic_tool_manager_initialization(self):
+    def test_dynamic_tool_manager_initialization(
+        self, mcp_server: StubMCPServer, make_manager: MakeManager
+    ) -> None:
         """Test DynamicToolManager initialization."""
-        mock_mcp_server = MagicMock()
-        config: Dict[str, Any] = {"openai": {"model": "gpt-4o-mini"}}
+        config: dict[str, Any] = {"openai": {"model": "gpt-4o-mini"}}
 
-        manager = DynamicToolManager(mock_mcp_server, config)
+        manager = make_manager(config)
 
-        assert manager.mcp_server == mock_mcp_server
+        assert manager.mcp_server is mcp_server
         assert manager.config == config
         assert manager.dynamic_tools == {}
 
-    @pytest.mark.asyncio
-    async def test_transform_tools_based_on_config(self):
+    async def test_transform_tools_based_on_config(
+        self,
+        make_manager: MakeManager,
+        patched_update_methods: Callable[[DynamicToolManager], dict[str, AsyncMock]],
+    ) -> None:
         """Test transform_tools_based_on_config method."""
-        mock_mcp_server = MagicMock()
-        config: Dict[str, Any] = {
+        config: dict[str, Any] = {
             "openai": {"model": "gpt-4o-mini", "temperature": 0.7},
             "chatbot": {"system_prompt": "You are helpful"},
             "logging": {"level": "INFO"},
         }
 
-        manager = DynamicToolManager(mock_mcp_server, config)
-
-        # Mock the private methods using patch
-        with (
-            patch.object(
-                manager, "_update_configuration_tools", new_callable=AsyncMock
-            ) as mock_config,
-            patch.object(
-                manager, "_update_openai_tools", new_callable=AsyncMock
-            ) as mock_openai,
-            patch.object(
-                manager, "_update_logging_tools", new_callable=AsyncMock
-            ) as mock_logging,
-            patch.object(
-                manager, "_update_chatbot_tools", new_callable=AsyncMock
-            ) as mock_chatbot,
-        ):
-
-            await manager.transform_tools_based_on_config()
-
-            # Verify all update methods were called
-            mock_config.assert_called_once()
-            mock_openai.assert_called_once()
-            mock_logging.assert_called_once()
-            mock_chatbot.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_update_configuration_tools(self):
+        manager = make_manager(config)
+
+        mocks = patched_update_methods(manager)
+
+        await manager.transform_tools_based_on_config()
+
+        # Verify all update methods were called
+        for mock in mocks.values():
+            mock.assert_called_once()
+
+    async def test_update_configuration_tools(self, make_manager: MakeManager) -> None:
         """Test _update_configuration_tools method."""
-        mock_mcp_server = MagicMock()
-        config: Dict[str, Dict[str, Any]] = {"openai": {}, "chatbot": {}}
+        config: dict[str, dict[str, Any]] = {"openai": {}, "chatbot": {}}
 
-        manager = DynamicToolManager(mock_mcp_server, config)
+        manager = make_manager(config)
 
         with patch.object(
             manager, "_create_section_tool", new_callable=AsyncMock
@@ -76,28 +121,25 @@ class TestDynamicToolManager:
             mock_create.assert_any_call("openai")
             mock_create.assert_any_call("chatbot")
 
-    @pytest.mark.asyncio
-    async def test_create_section_tool_new_tool(self):
+    async def test_create_section_tool_new_tool(
+        self, mcp_server: StubMCPServer, make_manager: MakeManager
+    ) -> None:
         """Test _create_section_tool for new tool creation."""
-        mock_mcp_server = MagicMock()
-        mock_tool_decorator = MagicMock()
-        mock_mcp_server.tool = mock_tool_decorator
-
-        config: Dict[str, Any] = {"openai": {"model": "gpt-4o-mini"}}
-        manager = DynamicToolManager(mock_mcp_server, config)
+        config: dict[str, Any] = {"openai": {"model": "gpt-4o-mini"}}
+        manager = make_manager(config)
 
         await manager._create_section_tool("openai")  # type: ignore[protected]
 
         # Should create the tool
         assert "get_openai_config" in manager.dynamic_tools
-        mock_tool_decorator.assert_called_once()
+        mcp_server.tool.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_create_section_tool_existing_tool(self):
+    async def test_create_section_tool_existing_tool(
+        self, make_manager: MakeManager
+    ) -> None:
         """Test _create_section_tool when tool already exists."""
-        mock_mcp_server = MagicMock()
-        config: Dict[str, Any] = {"openai": {"model": "gpt-4o-mini"}}
-        manager = DynamicToolManager(mock_mcp_server, config)
+        config: dict[str, Any] = {"openai": {"model": "gpt-4o-mini"}}
+        manager = make_manager(config)
 
         # Add existing tool
         manager.dynamic_tools["get_openai_config"] = MagicMock()
@@ -107,198 +149,154 @@ class TestDynamicToolManager:
         # Should not create new tool
         assert len(manager.dynamic_tools) == 1
 
-    @pytest.mark.asyncio
-    async def test_update_openai_tools_with_openai_config(self):
+    async def test_update_openai_tools_with_openai_config(
+        self, mcp_server: StubMCPServer, make_manager: MakeManager
+    ) -> None:
         """Test _update_openai_tools when OpenAI config exists."""
-        mock_mcp_server = MagicMock()
-        mock_tool_decorator = MagicMock()
-        mock_mcp_server.tool = mock_tool_decorator
-
-        config: Dict[str, Any] = {
+        config: dict[str, Any] = {
             "openai": {"model": "gpt-4o-mini", "max_tokens": 2000}
         }
-        manager = DynamicToolManager(mock_mcp_server, config)
+        manager = make_manager(config)
 
         await manager._update_openai_tools()  # type: ignore[protected]
 
         # Should create OpenAI tool
         assert "get_current_model_capabilities" in manager.dynamic_tools
-        mock_tool_decorator.assert_called_once()
+        mcp_server.tool.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_update_openai_tools_without_openai_config(self):
+    async def test_update_openai_tools_without_openai_config(
+        self, make_manager: MakeManager
+    ) -> None:
         """Test _update_openai_tools when OpenAI config doesn't exist."""
-        mock_mcp_server = MagicMock()
-        config: Dict[str, Any] = {"chatbot": {"system_prompt": "test"}}
-        manager = DynamicToolManager(mock_mcp_server, config)
+        config: dict[str, Any] = {"chatbot": {"system_prompt": "test"}}
+        manager = make_manager(config)
 
         await manager._update_openai_tools()  # type: ignore[protected]
 
         # Should not create any tools
         assert len(manager.dynamic_tools) == 0
 
-    @pytest.mark.asyncio
-    async def test_update_logging_tools_with_logging_config(self):
+    async def test_update_logging_tools_with_logging_config(
+        self, mcp_server: StubMCPServer, make_manager: MakeManager
+    ) -> None:
         """Test _update_logging_tools when logging config exists."""
-        mock_mcp_server = MagicMock()
-        mock_tool_decorator = MagicMock()
-        mock_mcp_server.tool = mock_tool_decorator
-
-        config: Dict[str, Any] = {"logging": {"level": "INFO", "enabled": True}}
-        manager = DynamicToolManager(mock_mcp_server, config)
+        config: dict[str, Any] = {"logging": {"level": "INFO", "enabled": True}}
+        manager = make_manager(config)
 
         await manager._update_logging_tools()  # type: ignore[protected]
 
         # Should create logging tool
         assert "analyze_logging_performance" in manager.dynamic_tools
-        mock_tool_decorator.assert_called_once()
+        mcp_server.tool.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_update_chatbot_tools_with_chatbot_config(self):
+    async def test_update_chatbot_tools_with_chatbot_config(
+        self, mcp_server: StubMCPServer, make_manager: MakeManager
+    ) -> None:
         """Test _update_chatbot_tools when chatbot config exists."""
-        mock_mcp_server = MagicMock()
-        mock_tool_decorator = MagicMock()
-        mock_mcp_server.tool = mock_tool_decorator
-
-        config: Dict[str, Any] = {
+        config: dict[str, Any] = {
             "chatbot": {
                 "system_prompt": "You are helpful",
                 "max_conversation_history": 100,
             }
         }
-        manager = DynamicToolManager(mock_mcp_server, config)
+        manager = make_manager(config)
 
         await manager._update_chatbot_tools()  # type: ignore[protected]
 
         # Should create chatbot tool
         assert "analyze_conversation_settings" in manager.dynamic_tools
-        mock_tool_decorator.assert_called_once()
-
-    def test_get_section_description_known_sections(self):
-        """Test get_section_description for known sections."""
-        mock_mcp_server = MagicMock()
-        config: Dict[str, Any] = {}
-        manager = DynamicToolManager(mock_mcp_server, config)
-
-        # Test known sections
-        assert "OpenAI API configuration" in manager.get_section_description("openai")
-        assert "Chatbot behavior settings" in manager.get_section_description("chatbot")
-        assert "Logging configuration" in manager.get_section_description("logging")
-
-    def test_get_section_description_unknown_section(self):
-        """Test get_section_description for unknown section."""
-        mock_mcp_server = MagicMock()
-        config: Dict[str, Any] = {}
-        manager = DynamicToolManager(mock_mcp_server, config)
-
-        result = manager.get_section_description("unknown_section")
-        assert "Configuration settings for unknown_section" in result
-
-    def test_get_model_info_known_models(self):
-        """Test get_model_info for known models."""
-        mock_mcp_server = MagicMock()
-        config: Dict[str, Any] = {}
-        manager = DynamicToolManager(mock_mcp_server, config)
-
-        # Test known models
-        gpt4o_info = manager.get_model_info("gpt-4o")
-        assert gpt4o_info["context_window"] == 128000
-        assert gpt4o_info["best_for"] == "complex reasoning"
-
-        gpt4o_mini_info = manager.get_model_info("gpt-4o-mini")
-        assert gpt4o_mini_info["context_window"] == 128000
-        assert gpt4o_mini_info["best_for"] == "fast responses"
-
-    def test_get_model_info_unknown_model(self):
-        """Test get_model_info for unknown model."""
-        mock_mcp_server = MagicMock()
-        config: Dict[str, Any] = {}
-        manager = DynamicToolManager(mock_mcp_server, config)
-
-        result = manager.get_model_info("unknown-model")
-        assert result["context_window"] == "unknown"
-        assert result["best_for"] == "general use"
-
-    def test_get_logging_performance_impact_known_levels(self):
-        """Test get_logging_performance_impact for known levels."""
-        mock_mcp_server = MagicMock()
-        config: Dict[str, Any] = {}
-        manager = DynamicToolManager(mock_mcp_server, config)
-
-        # Test known levels
-        assert "High I/O impact" in manager.get_logging_performance_impact("DEBUG")
-        assert "Moderate I/O impact" in manager.get_logging_performance_impact("INFO")
-        assert "Low I/O impact" in manager.get_logging_performance_impact("WARNING")
-
-    def test_get_logging_performance_impact_unknown_level(self):
-        """Test get_logging_performance_impact for unknown level."""
-        mock_mcp_server = MagicMock()
-        config: Dict[str, Any] = {}
-        manager = DynamicToolManager(mock_mcp_server, config)
-
-        result = manager.get_logging_performance_impact("UNKNOWN")
-        assert result == "Unknown impact"
-
-    def test_get_logging_recommendations_debug_level(self):
-        """Test get_logging_recommendations for DEBUG level."""
-        mock_mcp_server = MagicMock()
-        config: Dict[str, Any] = {}
-        manager = DynamicToolManager(mock_mcp_server, config)
-
-        recommendations = manager.get_logging_recommendations("DEBUG", enabled=True)
-        assert "Consider INFO level for production" in recommendations
-
-    def test_get_logging_recommendations_disabled_logging(self):
-        """Test get_logging_recommendations for disabled logging."""
-        mock_mcp_server = MagicMock()
-        config: Dict[str, Any] = {}
-        manager = DynamicToolManager(mock_mcp_server, config)
-
-        recommendations = manager.get_logging_recommendations("INFO", enabled=False)
-        assert "Enable logging for troubleshooting" in recommendations
-
-    def test_get_logging_recommendations_no_recommendations(self):
-        """Test get_logging_recommendations when no recommendations needed."""
-        mock_mcp_server = MagicMock()
-        config: Dict[str, Any] = {}
-        manager = DynamicToolManager(mock_mcp_server, config)
-
-        recommendations = manager.get_logging_recommendations("INFO", enabled=True)
-        assert len(recommendations) == 0
-
-    def test_analyze_prompt_tone_sarcastic(self):
-        """Test analyze_prompt_tone for sarcastic prompt."""
-        mock_mcp_server = MagicMock()
-        config: Dict[str, Any] = {}
-        manager = DynamicToolManager(mock_mcp_server, config)
-
-        result = manager.analyze_prompt_tone("You are a sarcastic assistant")
-        assert result == "sarcastic/humorous"
-
-    def test_analyze_prompt_tone_helpful(self):
-        """Test analyze_prompt_tone for helpful prompt."""
-        mock_mcp_server = MagicMock()
-        config: Dict[str, Any] = {}
-        manager = DynamicToolManager(mock_mcp_server, config)
-
-        result = manager.analyze_prompt_tone("You are a helpful assistant")
-        assert result == "helpful/professional"
-
-    def test_analyze_prompt_tone_neutral(self):
-        """Test analyze_prompt_tone for neutral prompt."""
-        mock_mcp_server = MagicMock()
-        config: Dict[str, Any] = {}
-        manager = DynamicToolManager(mock_mcp_server, config)
-
-        result = manager.analyze_prompt_tone("You are an assistant")
-        assert result == "neutral"
-
-    @pytest.mark.asyncio
-    async def test_regenerate_all_tools(self):
+        mcp_server.tool.assert_called_once()
+
+    @pytest.mark.parametrize(
+        ("section", "expected"),
+        [
+            ("openai", "OpenAI API configuration"),
+            ("chatbot", "Chatbot behavior settings"),
+            ("logging", "Logging configuration"),
+            ("unknown_section", "Configuration settings for unknown_section"),
+        ],
+    )
+    def test_get_section_description(
+        self, readonly_manager: DynamicToolManager, section: str, expected: str
+    ) -> None:
+        """Test get_section_description for known and unknown sections."""
+        assert expected in readonly_manager.get_section_description(section)
+
+    @pytest.mark.parametrize(
+        ("model", "context_window", "best_for"),
+        [
+            ("gpt-4o", 128000, "complex reasoning"),
+            ("gpt-4o-mini", 128000, "fast responses"),
+            ("unknown-model", "unknown", "general use"),
+        ],
+    )
+    def test_get_model_info(
+        self,
+        readonly_manager: DynamicToolManager,
+        model: str,
+        context_window: int | str,
+        best_for: str,
+    ) -> None:
+        """Test get_model_info for known and unknown models."""
+        info = readonly_manager.get_model_info(model)
+        assert info["context_window"] == context_window
+        assert info["best_for"] == best_for
+
+    @pytest.mark.parametrize(
+        ("level", "expected"),
+        [
+            ("DEBUG", "High I/O impact"),
+            ("INFO", "Moderate I/O impact"),
+            ("WARNING", "Low I/O impact"),
+            ("UNKNOWN", "Unknown impact"),
+        ],
+    )
+    def test_get_logging_performance_impact(
+        self, readonly_manager: DynamicToolManager, level: str, expected: str
+    ) -> None:
+        """Test get_logging_performance_impact for known and unknown levels."""
+        assert expected in readonly_manager.get_logging_performance_impact(level)
+
+    @pytest.mark.parametrize(
+        ("level", "enabled", "expected"),
+        [
+            ("DEBUG", True, ["Consider INFO level for production"]),
+            ("INFO", False, ["Enable logging for troubleshooting"]),
+            ("INFO", True, []),
+        ],
+    )
+    def test_get_logging_recommendations(
+        self,
+        readonly_manager: DynamicToolManager,
+        level: str,
+        enabled: bool,  # noqa: FBT001
+        expected: list[str],
+    ) -> None:
+        """Test get_logging_recommendations for each level and enabled state."""
+        recommendations = readonly_manager.get_logging_recommendations(
+            level, enabled=enabled
+        )
+        assert recommendations == expected
+
+    @pytest.mark.parametrize(
+        ("prompt", "expected"),
+        [
+            ("You are a sarcastic assistant", "sarcastic/humorous"),
+            ("You are a helpful assistant", "helpful/professional"),
+            ("You are a helpful but Sarcastic assistant", "sarcastic/humorous"),
+            ("You are an assistant", "neutral"),
+        ],
+    )
+    def test_analyze_prompt_tone(
+        self, readonly_manager: DynamicToolManager, prompt: str, expected: str
+    ) -> None:
+        """Test analyze_prompt_tone for sarcastic, helpful and neutral prompts."""
+        assert readonly_manager.analyze_prompt_tone(prompt) == expected
+
+    async def test_regenerate_all_tools(self, make_manager: MakeManager) -> None:
         """Test regenerate_all_tools method."""
-        mock_mcp_server = MagicMock()
-        config: Dict[str, Any] = {"openai": {"model": "gpt-4o-mini"}}
-        manager = DynamicToolManager(mock_mcp_server, config)
+        config: dict[str, Any] = {"openai": {"model": "gpt-4o-mini"}}
+        manager = make_manager(config)
 
         # Mock the transform method
         with patch.object(
@@ -309,14 +307,9 @@ class TestDynamicToolManager:
             # Should call transform_tools_based_on_config
             mock_transform.assert_called_once()
 
-    def test_dynamic_tools_tracking(self):
+    def test_dynamic_tools_tracking(self, make_manager: MakeManager) -> None:
         """Test that dynamic tools are properly tracked."""
-        mock_mcp_server = MagicMock()
-        mock_tool_decorator = MagicMock()
-        mock_mcp_server.tool = mock_tool_decorator
-
-        config: Dict[str, Any] = {"openai": {"model": "gpt-4o-mini"}}
-        manager = DynamicToolManager(mock_mcp_server, config)
+        manager = make_manager({})
 
         # Initially empty
         assert len(manager.dynamic_tools) == 0
@@ -326,14 +319,13 @@ class TestDynamicToolManager:
         assert len(manager.dynamic_tools) == 1
         assert "test_tool" in manager.dynamic_tools
 
-    def test_config_access(self):
+    def test_config_access(self, make_manager: MakeManager) -> None:
         """Test that config is properly accessible."""
-        mock_mcp_server = MagicMock()
-        config: Dict[str, Any] = {
+        config: dict[str, Any] = {
             "openai": {"model": "gpt-4o-mini"},
             "chatbot": {"system_prompt": "test"},
         }
-        manager = DynamicToolManager(mock_mcp_server, config)
+        manager = make_manager(config)
 
         assert manager.config["openai"]["model"] == "gpt-4o-mini"
         assert manager.config["chatbot"]["system_prompt"] == "test"
@@ -1,207 +1,203 @@
 """Basic tests for server module functionality."""
 
-# Import the server module
-import server.server
+import asyncio
+import json
+from pathlib import Path
+from types import ModuleType
+from unittest.mock import Mock
+
+import pytest
+
+TOOL_NAMES = (
+    "get_config_version",
+    "get_config",
+    "get_time",
+    "echo",
+    "calculate",
+    "update_config",
+    "save_config",
+    "load_config",
+    "reset_config",
+    "load_defaults",
+    "list_config_keys",
+)
+
+TOOL_DESCRIPTIONS = (
+    ("calculate", "Perform basic arithmetic"),
+    ("echo", "Echo back the input message"),
+    ("get_time", "Get the current time"),
+    ("get_config", "Get current configuration"),
+)
 
 
 class TestServerBasic:
     """Basic test suite for server module."""
 
-    def test_server_module_import(self):
+    def test_server_module_import(self, server_module: ModuleType) -> None:
         """Test that server module can be imported."""
-        assert server.server is not None
-        assert hasattr(server.server, "mcp")
+        assert server_module is not None
+        assert hasattr(server_module, "mcp")
 
-    def test_mcp_server_creation(self):
+    def test_mcp_server_creation(self, server_module: ModuleType) -> None:
         """Test that MCP server is created."""
-        assert server.server.mcp is not None
-        assert hasattr(server.server.mcp, "tool")
+        assert server_module.mcp is not None
+        assert hasattr(server_module.mcp, "tool")
 
-    def test_global_variables_exist(self):
+    def test_global_variables_exist(self, server_module: ModuleType) -> None:
         """Test that global variables are defined."""
-        assert hasattr(server.server, "_config")  # type: ignore[protected]
-        assert hasattr(server.server, "_config_version")  # type: ignore[protected]
-        assert hasattr(server.server, "_default_config")  # type: ignore[protected]
-        assert hasattr(server.server, "_config_file_path")  # type: ignore[protected]
-        assert hasattr(server.server, "_config_watcher_task")  # type: ignore[protected]
-        assert hasattr(server.server, "_dynamic_tool_manager")  # type: ignore[protected]
-
-    def test_config_file_path_is_path(self):
-        """Test that config file path is accessible via public interface."""
-        # Use public interface to test config functionality instead of accessing private attribute
-        assert hasattr(server.server, "get_config")
-        assert hasattr(server.server.get_config, "name")
-        assert server.server.get_config.name == "get_config"
-
-    def test_config_version_is_integer(self):
-        """Test that config version is accessible via public interface."""
-        # Use public interface to test config version functionality
-        assert hasattr(server.server, "get_config_version")
-        assert hasattr(server.server.get_config_version, "name")
-        assert server.server.get_config_version.name == "get_config_version"
-
-    def test_config_is_dict(self):
-        """Test that config is accessible via public interface."""
-        # Use public interface to test config functionality
-        assert hasattr(server.server, "get_config")
-        assert hasattr(server.server.get_config, "name")
-        assert server.server.get_config.name == "get_config"
-
-    def test_default_config_is_dict(self):
-        """Test that default config is accessible via public interface."""
-        # Use public interface to test default config functionality
-        assert hasattr(server.server, "load_defaults")
-        assert hasattr(server.server.load_defaults, "name")
-        assert server.server.load_defaults.name == "load_defaults"
-
-    def test_get_config_version_function_exists(self):
-        """Test that get_config_version function exists as a tool."""
-        assert hasattr(server.server, "get_config_version")
-        # It's a FunctionTool, not a callable function
-        assert hasattr(server.server.get_config_version, "name")
-        assert server.server.get_config_version.name == "get_config_version"
-
-    def test_get_config_function_exists(self):
-        """Test that get_config function exists as a tool."""
-        assert hasattr(server.server, "get_config")
-        # It's a FunctionTool, not a callable function
-        assert hasattr(server.server.get_config, "name")
-        assert server.server.get_config.name == "get_config"
-
-    def test_get_time_function_exists(self):
-        """Test that get_time function exists as a tool."""
-        assert hasattr(server.server, "get_time")
-        # It's a FunctionTool, not a callable function
-        assert hasattr(server.server.get_time, "name")
-        assert server.server.get_time.name == "get_time"
-
-    def test_echo_function_exists(self):
-        """Test that echo function exists as a tool."""
-        assert hasattr(server.server, "echo")
-        # It's a FunctionTool, not a callable function
-        assert hasattr(server.server.echo, "name")
-        assert server.server.echo.name == "echo"
-
-    def test_calculate_function_exists(self):
-        """Test that calculate function exists as a tool."""
-        assert hasattr(server.server, "calculate")
-        # It's a FunctionTool, not a callable function
-        assert hasattr(server.server.calculate, "name")
-        assert server.server.calculate.name == "calculate"
-
-    def test_calculate_tool_description(self):
-        """Test that calculate tool has proper description."""
-        desc = server.server.calculate.description
-        assert desc is not None and "Perform basic arithmetic" in desc
-
-    def test_echo_tool_description(self):
-        """Test that echo tool has proper description."""
-        desc = server.server.echo.description
-        assert desc is not None and "Echo back the input message" in desc
-
-    def test_get_time_tool_description(self):
-        """Test that get_time tool has proper description."""
-        desc = server.server.get_time.description
-        assert desc is not None and "Get the current time" in desc
-
-    def test_get_config_tool_description(self):
-        """Test that get_config tool has proper description."""
-        desc = server.server.get_config.description
-        assert desc is not None and "Get current configuration" in desc
-
-    def test_async_reload_config_function_exists(self):
+        required = {
+            "_config",
+            "_config_version",
+            "_default_config",
+            "_config_file_path",
+            "_config_watcher_task",
+            "_dynamic_tool_manager",
+        }
+        assert required <= vars(server_module).keys()
+
+    def test_global_types(self, server_module: ModuleType) -> None:
+        """Test that the config globals have the expected types."""
+        checks = (
+            ("_config_file_path", Path),
+            ("_config_version", int),
+            ("_config", dict),
+            ("_default_config", dict),
+        )
+        for name, expected_type in checks:
+            assert isinstance(getattr(server_module, name), expected_type), name
+
+    @pytest.mark.parametrize("tool_name", TOOL_NAMES)
+    def test_tool_exists(self, server_module: ModuleType, tool_name: str) -> None:
+        """Test that each tool is registered as a FunctionTool with its name."""
+        tool = getattr(server_module, tool_name)
+        assert tool.name == tool_name
+
+    @pytest.mark.parametrize(("tool_name", "needle"), TOOL_DESCRIPTIONS)
+    def test_tool_descriptions(
+        self, server_module: ModuleType, tool_name: str, needle: str
+    ) -> None:
+        """Test that each tool has a description mentioning what it does."""
+        desc = getattr(server_module, tool_name).description
+        assert desc is not None
+        assert needle in desc
+
+    def test_async_reload_config_function_exists(
+        self, server_module: ModuleType
+    ) -> None:
         """Test that _async_reload_config function exists."""
-        assert hasattr(server.server, "_async_reload_config")  # type: ignore[protected]
-        assert callable(server.server._async_reload_config)  # type: ignore[protected]
+        assert callable(server_module._async_reload_config)  # type: ignore[protected]
 
-    def test_async_load_default_config_function_exists(self):
+    def test_async_load_default_config_function_exists(
+        self, server_module: ModuleType
+    ) -> None:
         """Test that _async_load_default_config function exists."""
-        assert hasattr(server.server, "_async_load_default_config")  # type: ignore[protected]
-        assert callable(server.server._async_load_default_config)  # type: ignore[protected]
+        assert callable(server_module._async_load_default_config)  # type: ignore[protected]
 
-    def test_load_default_config_function_exists(self):
+    def test_load_default_config_function_exists(
+        self, server_module: ModuleType
+    ) -> None:
         """Test that _load_default_config function exists."""
-        assert hasattr(server.server, "_load_default_config")  # type: ignore[protected]
-        assert callable(server.server._load_default_config)  # type: ignore[protected]
+        assert callable(server_module._load_default_config)  # type: ignore[protected]
 
-    def test_start_config_watcher_function_exists(self):
+    def test_start_config_watcher_function_exists(
+        self, server_module: ModuleType
+    ) -> None:
         """Test that _start_config_watcher function exists."""
-        assert hasattr(server.server, "_start_config_watcher")  # type: ignore[protected]
-        assert callable(server.server._start_config_watcher)  # type: ignore[protected]
+        assert callable(server_module._start_config_watcher)  # type: ignore[protected]
 
-    def test_stop_config_watcher_function_exists(self):
+    def test_stop_config_watcher_function_exists(
+        self, server_module: ModuleType
+    ) -> None:
         """Test that _stop_config_watcher function exists."""
-        assert hasattr(server.server, "_stop_config_watcher")  # type: ignore[protected]
-        assert callable(server.server._stop_config_watcher)  # type: ignore[protected]
-
-    def test_update_config_function_exists(self):
-        """Test that update_config function exists as a tool."""
-        assert hasattr(server.server, "update_config")
-        assert hasattr(server.server.update_config, "name")
-        assert server.server.update_config.name == "update_config"
-
-    def test_save_config_function_exists(self):
-        """Test that save_config function exists as a tool."""
-        assert hasattr(server.server, "save_config")
-        assert hasattr(server.server.save_config, "name")
-        assert server.server.save_config.name == "save_config"
-
-    def test_load_config_function_exists(self):
-        """Test that load_config function exists as a tool."""
-        assert hasattr(server.server, "load_config")
-        assert hasattr(server.server.load_config, "name")
-        assert server.server.load_config.name == "load_config"
-
-    def test_reset_config_function_exists(self):
-        """Test that reset_config function exists as a tool."""
-        assert hasattr(server.server, "reset_config")
-        assert hasattr(server.server.reset_config, "name")
-        assert server.server.reset_config.name == "reset_config"
-
-    def test_load_defaults_function_exists(self):
-        """Test that load_defaults function exists as a tool."""
-        assert hasattr(server.server, "load_defaults")
-        assert hasattr(server.server.load_defaults, "name")
-        assert server.server.load_defaults.name == "load_defaults"
-
-    def test_list_config_keys_function_exists(self):
-        """Test that list_config_keys function exists as a tool."""
-        assert hasattr(server.server, "list_config_keys")
-        assert hasattr(server.server.list_config_keys, "name")
-        assert server.server.list_config_keys.name == "list_config_keys"
-
-    def test_dynamic_tool_manager_import(self):
-        """Test that DynamicToolManager is imported."""
-        assert hasattr(server.server, "DynamicToolManager")
-
-    def test_fastmcp_import(self):
-        """Test that FastMCP is imported."""
-        assert hasattr(server.server, "FastMCP")
-
-    def test_yaml_import(self):
-        """Test that yaml is imported."""
-        assert hasattr(server.server, "yaml")
-
-    def test_aiofiles_import(self):
-        """Test that aiofiles is imported."""
-        assert hasattr(server.server, "aiofiles")
-
-    def test_watchfiles_import(self):
-        """Test that watchfiles is imported."""
-        assert hasattr(server.server, "awatch")
-
-    def test_logging_setup(self):
+        assert callable(server_module._stop_config_watcher)  # type: ignore[protected]
+
+    def test_dependencies_imported(self, server_module: ModuleType) -> None:
+        """Test that the server's third-party and local dependencies are imported."""
+        required = {"DynamicToolManager", "FastMCP", "yaml", "aiofiles", "awatch"}
+        assert required <= vars(server_module).keys()
+
+    def test_logging_setup(self, server_module: ModuleType) -> None:
         """Test that logging is set up."""
-        assert hasattr(server.server, "logger")
-        assert server.server.logger is not None
+        assert server_module.logger is not None
 
-    def test_mcp_server_name(self):
+    def test_mcp_server_name(self, server_module: ModuleType) -> None:
         """Test that MCP server has correct name."""
-        assert server.server.mcp.name == "config_aware_server"
-
-    def test_mcp_server_has_tools(self):
-        """Test that MCP server has tools."""
-        # The server should have tools registered
-        # FastMCP doesn't expose tools directly, but we can check that tools exist
-        assert hasattr(server.server.mcp, "name")
-        assert server.server.mcp.name == "config_aware_server"
+        assert server_module.mcp.name == "config_aware_server"
+
+    async def test_mcp_server_has_tools(self, server_module: ModuleType) -> None:
+        """Test that every tool is registered on the MCP server."""
+        tools = await server_module.mcp.get_tools()
+        assert set(TOOL_NAMES) <= tools.keys()
+
+    def test_update_config_value_parsing(self, server_module: ModuleType) -> None:
+        """Test that update_config values are coerced to the expected types."""
+        parse = server_module._parse_value  # type: ignore[protected]
+        assert parse("0.7") == 0.7
+        assert parse("-3") == -3
+        assert parse("true") is True
+        assert parse("None") is None
+        assert parse("[1, 2]") == [1, 2]
+        assert parse("gpt-4o-mini") == "gpt-4o-mini"
+        assert parse("[not json") == "[not json"
+
+    @pytest.mark.parametrize(
+        "value", ["0123", "+5", "1_000", "nan", "inf", "\u0663", " 42", "1e3", "-0.5"]
+    )
+    def test_update_config_value_parsing_matches_json(
+        self, server_module: ModuleType, value: str
+    ) -> None:
+        """Test that numeric-looking values parse exactly as json.loads would."""
+        try:
+            expected = json.loads(value)
+        except json.JSONDecodeError:
+            expected = value
+        parsed = server_module._parse_value(value)  # type: ignore[protected]
+        assert parsed == expected
+        assert type(parsed) is type(expected)
+
+    async def test_write_config_writes_a_snapshot(
+        self, server_module: ModuleType, tmp_path: Path
+    ) -> None:
+        """Test that changes made while a write is in flight don't reach the file."""
+        config = {"openai": {"temperature": 0.5}}
+        path = tmp_path / "config.yaml"
+
+        write = asyncio.create_task(
+            server_module._write_config(config, path)  # type: ignore[protected]
+        )
+        await asyncio.sleep(0)
+        config["openai"]["temperature"] = 1.5
+        await write
+
+        written = server_module._parse_config(path.read_bytes())  # type: ignore[protected]
+        assert written == {"openai": {"temperature": 0.5}}
+
+    async def test_lifespans_share_the_config_watcher(
+        self, server_module: ModuleType, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the watcher keeps running until the last session ends."""
+        stop = Mock()
+        monkeypatch.setattr(server_module, "_dynamic_tool_manager", None)
+        monkeypatch.setattr(server_module, "_start_config_watcher", Mock())
+        monkeypatch.setattr(server_module, "_stop_config_watcher", stop)
+        lifespan = server_module._lifespan  # type: ignore[protected]
+
+        async with lifespan(server_module.mcp):
+            async with lifespan(server_module.mcp):
+                pass
+            stop.assert_not_called()
+        stop.assert_called_once()
+
+    def test_fresh_defaults_do_not_alias_defaults(
+        self, server_module: ModuleType, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that mutating a copy of the defaults leaves the defaults intact."""
+        # Reloading rebinds the shared module's defaults; restore them afterwards
+        for name in ("_default_config", "_default_config_yaml"):
+            monkeypatch.setattr(server_module, name, getattr(server_module, name))
+        assert server_module._load_default_config()  # type: ignore[protected]
+        fresh = server_module._fresh_defaults()  # type: ignore[protected]
+        section = next(iter(fresh))
+        fresh[section]["__probe__"] = True
+        defaults = server_module._default_config  # type: ignore[protected]
+        assert "__probe__" not in defaults[section]